@@ -4,12 +4,11 @@ from __future__ import annotations
 
 from collections import Counter
 from dataclasses import dataclass
-from itertools import accumulate
 from math import comb, erfc, sqrt
 from random import Random
-from statistics import median
 from typing import Dict, List, Sequence
 
+import numpy as np
 from scipy import stats
 from scipy.special import gammaincc
 
@@ -100,24 +99,39 @@ class RandomnessTestResult:
     detail: Dict[str, float] | None = None
 
 
-def _flatten_numbers(draws: Sequence[LottoDraw]) -> List[int]:
-    numbers: List[int] = []
-    for draw in draws:
-        numbers.extend(draw.numbers)
-    return numbers
+def _number_matrix(draws: Sequence[LottoDraw]) -> np.ndarray:
+    """Return the winning numbers as a (draws, 6) integer array.
 
+    Converting the draw objects once lets every test below work on columns
+    instead of looping over per-draw Python lists.
+    """
 
-def calculate_number_frequencies(draws: Sequence[LottoDraw]) -> Dict[int, int]:
-    """Count how many times each number (1~45) appears."""
+    return np.array(
+        [draw.numbers for draw in draws], dtype=np.intp
+    ).reshape(len(draws), BALLS_PER_DRAW)
+
+
+def _count_runs(sequence: np.ndarray) -> int:
+    return 1 + int(np.count_nonzero(sequence[1:] != sequence[:-1]))
+
+
+def _sorted_gaps(numbers: np.ndarray) -> np.ndarray:
+    """Gaps between consecutive sorted numbers, draw by draw."""
 
-    counts = Counter()
-    for number in _flatten_numbers(draws):
-        counts[number] += 1
+    return np.diff(np.sort(numbers, axis=1), axis=1).ravel()
 
-    for num in range(1, TOTAL_BALLS + 1):
-        counts.setdefault(num, 0)
 
-    return dict(sorted(counts.items()))
+def number_counts(draws: Sequence[LottoDraw]) -> np.ndarray:
+    """Occurrences per number as an array indexed by number (index 0 unused)."""
+
+    return np.bincount(_number_matrix(draws).ravel(), minlength=TOTAL_BALLS + 1)
+
+
+def calculate_number_frequencies(draws: Sequence[LottoDraw]) -> Dict[int, int]:
+    """Count how many times each number (1~45) appears."""
+
+    counts = number_counts(draws)
+    return {num: int(counts[num]) for num in range(1, TOTAL_BALLS + 1)}
 
 
 def chi_square_uniformity_test(draws: Sequence[LottoDraw]) -> ChiSquareResult:
@@ -145,16 +159,13 @@ def chi_square_uniformity_test(draws: Sequence[LottoDraw]) -> ChiSquareResult:
 def runs_test_even_odd(draws: Sequence[LottoDraw]) -> RunsTestResult:
     """Runs test on the parity sequence (even vs odd)."""
 
-    sequence = [num % 2 for num in _flatten_numbers(draws)]
+    sequence = _number_matrix(draws).ravel() % 2
     if len(sequence) < 2:
         raise ValueError("At least two numbers are required for the runs test.")
 
-    runs = 1
-    for prev, curr in zip(sequence, sequence[1:]):
-        if prev != curr:
-            runs += 1
+    runs = _count_runs(sequence)
 
-    n1 = sum(sequence)  # count of odd numbers (1s)
+    n1 = int(sequence.sum())  # count of odd numbers (1s)
     n0 = len(sequence) - n1  # evens
 
     if n0 == 0 or n1 == 0:
@@ -180,18 +191,17 @@ def runs_test_even_odd(draws: Sequence[LottoDraw]) -> RunsTestResult:
 def gap_histogram(draws: Sequence[LottoDraw]) -> Dict[int, int]:
     """Histogram of gaps between sorted numbers within each draw."""
 
-    histogram: Counter[int] = Counter()
-    for draw in draws:
-        sorted_numbers = sorted(draw.numbers)
-        for prev, curr in zip(sorted_numbers, sorted_numbers[1:]):
-            histogram[curr - prev] += 1
-    return dict(sorted(histogram.items()))
+    gaps, counts = np.unique(
+        _sorted_gaps(_number_matrix(draws)), return_counts=True
+    )
+    return dict(zip(gaps.tolist(), counts.tolist()))
 
 
-def summarize_draws() -> Dict[str, object]:
+def summarize_draws(draws: Sequence[LottoDraw] | None = None) -> Dict[str, object]:
     """Convenience helper returning common analysis outputs."""
 
-    draws = load_stored_draws()
+    if draws is None:
+        draws = load_stored_draws()
     if not draws:
         raise ValueError("No draws found locally. Run /lotto/sync first.")
 
@@ -210,19 +220,16 @@ def summarize_draws() -> Dict[str, object]:
 def runs_test_on_sums(draws: Sequence[LottoDraw]) -> SumRunsTestResult:
     """회차 합계를 중앙값 기준 이진 시퀀스로 변환하여 런 검정."""
 
-    sums = [sum(draw.numbers) for draw in draws]
+    sums = _number_matrix(draws).sum(axis=1)
     if len(sums) < 2:
         raise ValueError("At least two draws are required for sum runs test.")
 
-    median_threshold = float(median(sums))
-    sequence = [1 if draw_sum >= median_threshold else 0 for draw_sum in sums]
+    median_threshold = float(np.median(sums))
+    sequence = sums >= median_threshold
 
-    runs = 1
-    for prev, curr in zip(sequence, sequence[1:]):
-        if prev != curr:
-            runs += 1
+    runs = _count_runs(sequence)
 
-    n1 = sum(sequence)
+    n1 = int(np.count_nonzero(sequence))
     n0 = len(sequence) - n1
     if n0 == 0 or n1 == 0:
         raise ValueError("Sequence must contain both sides of the median.")
@@ -245,27 +252,6 @@ def runs_test_on_sums(draws: Sequence[LottoDraw]) -> SumRunsTestResult:
     )
 
 
-def _binary_series_for_number(draws: Sequence[LottoDraw], number: int) -> List[int]:
-    return [1 if number in draw.numbers else 0 for draw in draws]
-
-
-def _autocorrelation(series: Sequence[int], lag: int) -> float | None:
-    n = len(series)
-    if lag <= 0 or lag >= n:
-        return None
-
-    mean = sum(series) / n
-    numerator = 0.0
-    for i in range(n - lag):
-        numerator += (series[i] - mean) * (series[i + lag] - mean)
-
-    denominator = sum((value - mean) ** 2 for value in series)
-    if denominator == 0:
-        return 0.0
-
-    return numerator / denominator
-
-
 def _ljung_box(
     series_length: int, lag_results: Sequence[AutocorrelationLagResult]
 ) -> tuple[float | None, float | None]:
@@ -286,6 +272,37 @@ def _ljung_box(
     return float(q_stat), float(p_value)
 
 
+def _presence_matrix(draws: Sequence[LottoDraw]) -> np.ndarray:
+    """Return a (draws, 45) 0/1 matrix; column ``k`` is number ``k + 1``."""
+
+    matrix = np.zeros((len(draws), TOTAL_BALLS), dtype=np.float64)
+    rows = np.repeat(np.arange(len(draws)), BALLS_PER_DRAW)
+    matrix[rows, _number_matrix(draws).ravel() - 1] = 1.0
+    return matrix
+
+
+def _autocorrelation_matrix(presence: np.ndarray, max_lag: int) -> np.ndarray:
+    """Lag 1..max_lag sample autocorrelation of every column at once.
+
+    Row ``lag - 1`` holds the coefficients for that lag; lags >= n are NaN and
+    constant columns get 0.0.
+    """
+
+    n = presence.shape[0]
+    centered = presence - presence.mean(axis=0)
+    denominator = np.einsum("ij,ij->j", centered, centered)
+    coefficients = np.full((max_lag, presence.shape[1]), np.nan)
+    for lag in range(1, min(max_lag, n - 1) + 1):
+        numerator = np.einsum("ij,ij->j", centered[:-lag], centered[lag:])
+        coefficients[lag - 1] = np.divide(
+            numerator,
+            denominator,
+            out=np.zeros_like(numerator),
+            where=denominator != 0,
+        )
+    return coefficients
+
+
 def number_autocorrelation(
     draws: Sequence[LottoDraw],
     max_lag: int = 5,
@@ -293,23 +310,24 @@ def number_autocorrelation(
     if len(draws) < 2:
         raise ValueError("At least two draws are required for autocorrelation.")
 
+    series_length = len(draws)
+    coefficients = _autocorrelation_matrix(_presence_matrix(draws), max_lag)
     results: List[NumberAutocorrelationResult] = []
     for number in range(1, TOTAL_BALLS + 1):
-        series = _binary_series_for_number(draws, number)
         lag_entries: List[AutocorrelationLagResult] = []
         for lag in range(1, max_lag + 1):
-            coeff = _autocorrelation(series, lag)
-            if coeff is None:
+            coeff = coefficients[lag - 1, number - 1]
+            if np.isnan(coeff):
                 continue
             lag_entries.append(
                 AutocorrelationLagResult(
                     lag=lag,
                     coefficient=float(coeff),
-                    sample_size=len(series) - lag,
+                    sample_size=series_length - lag,
                 )
             )
 
-        q_stat, p_value = _ljung_box(len(series), lag_entries)
+        q_stat, p_value = _ljung_box(series_length, lag_entries)
         results.append(
             NumberAutocorrelationResult(
                 number=number,
@@ -362,8 +380,12 @@ def carry_over_analysis(draws: Sequence[LottoDraw]) -> CarryOverAnalysisResult:
     )
 
 
-def dependency_summary(max_lag: int = 5) -> Dict[str, object]:
-    draws = load_stored_draws()
+def dependency_summary(
+    max_lag: int = 5,
+    draws: Sequence[LottoDraw] | None = None,
+) -> Dict[str, object]:
+    if draws is None:
+        draws = load_stored_draws()
     if len(draws) < 2:
         raise ValueError("최소 2회 이상의 회차 데이터가 필요합니다. /lotto/sync를 실행하세요.")
 
@@ -374,8 +396,6 @@ def dependency_summary(max_lag: int = 5) -> Dict[str, object]:
         "autocorrelation": [
             {
                 "number": entry.number,
-                "ljung_box_q": entry.ljung_box_q,
-                "p_value": entry.p_value,
                 "lags": [
                     {
                         "lag": lag_result.lag,
@@ -384,6 +404,8 @@ def dependency_summary(max_lag: int = 5) -> Dict[str, object]:
                     }
                     for lag_result in entry.lags
                 ],
+                "ljung_box_q": entry.ljung_box_q,
+                "p_value": entry.p_value,
             }
             for entry in autocorr_results
         ],
@@ -397,8 +419,9 @@ def dependency_summary(max_lag: int = 5) -> Dict[str, object]:
     }
 
 
-def sum_runs_summary() -> SumRunsTestResult:
-    draws = load_stored_draws()
+def sum_runs_summary(draws: Sequence[LottoDraw] | None = None) -> SumRunsTestResult:
+    if draws is None:
+        draws = load_stored_draws()
     if len(draws) < 2:
         raise ValueError("최소 2회 이상의 회차가 필요합니다. /lotto/sync를 먼저 실행하세요.")
     return runs_test_on_sums(draws)
@@ -418,17 +441,12 @@ def parity_pattern_analysis(draws: Sequence[LottoDraw]) -> PatternChiSquareResul
     if not draws:
         raise ValueError("No draws available for parity analysis.")
 
-    counts: Counter[str] = Counter()
-    for draw in draws:
-        odd = sum(1 for num in draw.numbers if num % 2 == 1)
-        key = f"{odd}:{BALLS_PER_DRAW - odd}"
-        counts[key] += 1
-
+    counts = np.bincount(
+        np.count_nonzero(_number_matrix(draws) % 2, axis=1),
+        minlength=BALLS_PER_DRAW + 1,
+    )
     observed = {
-        f"{odd}:{BALLS_PER_DRAW - odd}": counts.get(
-            f"{odd}:{BALLS_PER_DRAW - odd}",
-            0,
-        )
+        f"{odd}:{BALLS_PER_DRAW - odd}": int(counts[odd])
         for odd in range(BALLS_PER_DRAW + 1)
     }
     expected: Dict[str, float] = {}
@@ -451,17 +469,12 @@ def low_high_pattern_analysis(draws: Sequence[LottoDraw]) -> PatternChiSquareRes
     if not draws:
         raise ValueError("No draws available for low/high analysis.")
 
-    counts: Counter[str] = Counter()
-    for draw in draws:
-        low = sum(1 for num in draw.numbers if num <= LOW_BALLS)
-        key = f"{low}:{BALLS_PER_DRAW - low}"
-        counts[key] += 1
-
+    counts = np.bincount(
+        np.count_nonzero(_number_matrix(draws) <= LOW_BALLS, axis=1),
+        minlength=BALLS_PER_DRAW + 1,
+    )
     observed = {
-        f"{low}:{BALLS_PER_DRAW - low}": counts.get(
-            f"{low}:{BALLS_PER_DRAW - low}",
-            0,
-        )
+        f"{low}:{BALLS_PER_DRAW - low}": int(counts[low])
         for low in range(BALLS_PER_DRAW + 1)
     }
     expected: Dict[str, float] = {}
@@ -484,12 +497,8 @@ def last_digit_analysis(draws: Sequence[LottoDraw]) -> PatternChiSquareResult:
     if not draws:
         raise ValueError("No draws available for last digit analysis.")
 
-    counts: Counter[str] = Counter()
-    for draw in draws:
-        for num in draw.numbers:
-            counts[str(num % 10)] += 1
-
-    observed = {str(digit): counts.get(str(digit), 0) for digit in range(10)}
+    counts = np.bincount(_number_matrix(draws).ravel() % 10, minlength=10)
+    observed = {str(digit): int(counts[digit]) for digit in range(10)}
     total_numbers = len(draws) * BALLS_PER_DRAW
     expected = {
         str(digit): (DIGIT_COUNTS[digit] / TOTAL_BALLS) * total_numbers
@@ -505,8 +514,11 @@ def last_digit_analysis(draws: Sequence[LottoDraw]) -> PatternChiSquareResult:
     )
 
 
-def pattern_analysis_summary() -> Dict[str, PatternChiSquareResult]:
-    draws = load_stored_draws()
+def pattern_analysis_summary(
+    draws: Sequence[LottoDraw] | None = None,
+) -> Dict[str, PatternChiSquareResult]:
+    if draws is None:
+        draws = load_stored_draws()
     if not draws:
         raise ValueError("No draws available. Run /lotto/sync first.")
 
@@ -584,7 +596,7 @@ def sum_distribution_analysis(
     sample_size: int = 100_000,
     simulated: tuple[List[int], Counter[int]] | None = None,
 ) -> DistributionComparisonResult:
-    actual_sums = [sum(draw.numbers) for draw in draws]
+    actual_sums = _number_matrix(draws).sum(axis=1).tolist()
     observed_hist = Counter(actual_sums)
 
     if simulated is None:
@@ -620,14 +632,8 @@ def gap_distribution_analysis(
     sample_size: int = 100_000,
     simulated: tuple[List[int], Counter[int]] | None = None,
 ) -> DistributionComparisonResult:
-    observed_gaps: List[int] = []
-    observed_hist: Counter[int] = Counter()
-    for draw in draws:
-        sorted_numbers = sorted(draw.numbers)
-        for prev, curr in zip(sorted_numbers, sorted_numbers[1:]):
-            gap = curr - prev
-            observed_gaps.append(gap)
-            observed_hist[gap] += 1
+    observed_gaps: List[int] = _sorted_gaps(_number_matrix(draws)).tolist()
+    observed_hist: Counter[int] = Counter(observed_gaps)
 
     if simulated is None:
         _, _, simulated_gaps, simulated_hist = _simulate_reference_draws(
@@ -657,8 +663,12 @@ def gap_distribution_analysis(
     )
 
 
-def distribution_summary(sample_size: int = 100_000) -> Dict[str, DistributionComparisonResult]:
-    draws = load_stored_draws()
+def distribution_summary(
+    sample_size: int = 100_000,
+    draws: Sequence[LottoDraw] | None = None,
+) -> Dict[str, DistributionComparisonResult]:
+    if draws is None:
+        draws = load_stored_draws()
     if not draws:
         raise ValueError("No draws available. Run /lotto/sync first.")
 
@@ -740,7 +750,7 @@ def _block_frequency_test(bits: Sequence[int], block_size: int) -> RandomnessTes
         pi = sum(block) / block_size
         chi_square += (pi - 0.5) ** 2
     chi_square *= 4 * block_size
-    p_value = gammaincc(num_blocks / 2, chi_square / 2)
+    p_value = float(gammaincc(num_blocks / 2, chi_square / 2))
     return RandomnessTestResult(
         name="block_frequency",
         statistic=chi_square,
@@ -788,13 +798,15 @@ def _psi2(bits: Sequence[int], m: int) -> float:
     if m == 0 or n == 0:
         return 0.0
 
-    frequency: Counter[tuple[int, ...]] = Counter()
-    extended = list(bits) + list(bits[: m - 1])
-    for i in range(n):
-        block = tuple(extended[i : i + m])
-        frequency[block] += 1
+    # Encode every overlapping m-bit window as an integer and histogram them.
+    array = np.asarray(bits, dtype=np.int64)
+    extended = np.concatenate((array, array[: m - 1]))
+    codes = np.zeros(n, dtype=np.int64)
+    for offset in range(m):
+        codes = (codes << 1) | extended[offset : offset + n]
+    counts = np.bincount(codes, minlength=2**m)
 
-    total = sum(count**2 for count in frequency.values())
+    total = int(np.dot(counts, counts))
     return (total * (2**m) / n) - n
 
 
@@ -812,8 +824,8 @@ def _serial_test(bits: Sequence[int], m: int) -> RandomnessTestResult:
     delta1 = psi_m - psi_m1
     delta2 = psi_m - 2 * psi_m1 + psi_m2
 
-    p_value1 = gammaincc(2 ** (m - 1) / 2, delta1 / 2)
-    p_value2 = gammaincc(2 ** (m - 2) / 2, delta2 / 2)
+    p_value1 = float(gammaincc(2 ** (m - 1) / 2, delta1 / 2))
+    p_value2 = float(gammaincc(2 ** (m - 2) / 2, delta2 / 2))
 
     passed = (p_value1 >= RANDOMNESS_ALPHA) and (p_value2 >= RANDOMNESS_ALPHA)
     return RandomnessTestResult(
@@ -833,19 +845,17 @@ def _cumulative_sums_p_value(partial_sums: Sequence[int]) -> float:
     if n == 0:
         return 1.0
 
-    z = max(abs(value) for value in partial_sums)
+    z = int(np.max(np.abs(partial_sums)))
     if z == 0:
         return 1.0
 
     sqrt_n = sqrt(n)
 
     def _range_sum(start: int, end: int, offset: int) -> float:
-        total = 0.0
-        for k in range(start, end + 1):
-            term1 = ((4 * k + offset) * z) / sqrt_n
-            term2 = ((4 * k + offset - 2) * z) / sqrt_n
-            total += stats.norm.cdf(term1) - stats.norm.cdf(term2)
-        return total
+        k = np.arange(start, end + 1)
+        term1 = ((4 * k + offset) * z) / sqrt_n
+        term2 = ((4 * k + offset - 2) * z) / sqrt_n
+        return float(np.sum(stats.norm.cdf(term1) - stats.norm.cdf(term2)))
 
     start_k = int(((-n / z) + 1) / 4)
     end_k = int(((n / z) - 1) / 4)
@@ -863,9 +873,9 @@ def _cumulative_sums_test(bits: Sequence[int]) -> RandomnessTestResult:
     if n < 100:
         raise ValueError("Cumulative sums test requires at least 100 bits.")
 
-    adjusted = [1 if bit else -1 for bit in bits]
-    forward_sums = list(accumulate(adjusted))
-    backward_sums = list(accumulate(reversed(adjusted)))
+    adjusted = np.where(np.asarray(bits, dtype=bool), 1, -1)
+    forward_sums = np.cumsum(adjusted)
+    backward_sums = np.cumsum(adjusted[::-1])
 
     p_forward = _cumulative_sums_p_value(forward_sums)
     p_backward = _cumulative_sums_p_value(backward_sums)
@@ -873,7 +883,7 @@ def _cumulative_sums_test(bits: Sequence[int]) -> RandomnessTestResult:
 
     return RandomnessTestResult(
         name="cumulative_sums",
-        statistic=max(abs(value) for value in forward_sums),
+        statistic=float(np.max(np.abs(forward_sums))),
         p_value=min(p_forward, p_backward),
         passed=passed,
         detail={
@@ -901,8 +911,10 @@ def randomness_suite_summary(
     encoding: str = "presence",
     block_size: int = 128,
     serial_block: int = 2,
+    draws: Sequence[LottoDraw] | None = None,
 ) -> Dict[str, object]:
-    draws = load_stored_draws()
+    if draws is None:
+        draws = load_stored_draws()
     if not draws:
         raise ValueError("No draws available. Run /lotto/sync first.")
 
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict
+import logging
+from typing import Any, Callable, Dict, List
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 
 from analysis import distribution_summary
+from app.core.responses import ORJSONResponse
 from app.models.dto import (
     DependencyAnalysisResponse,
     DependencyAnalysisSnapshotResponse,
@@ -20,7 +22,12 @@ from app.models.dto import (
     SumRunsTestResponse,
     SumRunsTestSnapshotResponse,
 )
-from app.services.analysis_storage import get_latest_analysis_snapshot, save_analysis_snapshot
+from app.services.analysis_storage import (
+    SnapshotEntry,
+    get_latest_analysis_snapshot,
+    require_database_backend,
+    save_analysis_snapshots,
+)
 from app.services.analysis_tasks import (
     analysis_key,
     refresh_dependency_analysis,
@@ -31,6 +38,8 @@ from app.services.analysis_tasks import (
 )
 from app.services.auth import require_access_token
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(
     prefix="/analysis",
     tags=["analysis"],
@@ -74,11 +83,37 @@ def _ensure_snapshot(name: str, refresher: SnapshotRefresher) -> Dict[str, Any]:
         return _load_snapshot_or_404(name)
 
 
-def _store_snapshot(name: str, payload: Dict[str, Any], metadata: Dict[str, Any] | None = None) -> None:
+def _pending_snapshots() -> List[SnapshotEntry]:
+    """Return an empty write queue, or 503 when snapshots cannot be stored."""
+
     try:
-        save_analysis_snapshot(name, payload, metadata=metadata)
+        require_database_backend()
     except RuntimeError as exc:
         raise HTTPException(status_code=503, detail={"message": str(exc)}) from exc
+    return []
+
+
+def _save_snapshots_after_response(pending: List[SnapshotEntry]) -> None:
+    try:
+        save_analysis_snapshots(pending)
+    except Exception:  # noqa: BLE001  # response already sent; log only
+        logger.exception(
+            "Failed to store analysis snapshots: %s",
+            [name for name, _, _ in pending],
+        )
+
+
+# POST handlers answer before the background task stores the snapshot, so a
+# GET issued right after may still return the previous result.
+_SNAPSHOT_PENDING_DESCRIPTION = (
+    "분석 결과는 응답 전송 후 백그라운드에서 저장됩니다. "
+    "직후의 GET 요청은 이전 스냅샷을 반환할 수 있으며, "
+    "응답의 `X-Snapshot-Pending: 1` 헤더가 이를 나타냅니다."
+)
+
+
+def _snapshot_pending_response(payload: Dict[str, Any]) -> ORJSONResponse:
+    return ORJSONResponse(payload, headers={"X-Snapshot-Pending": "1"})
 
 
 def _serialize_distribution_result(result):
@@ -113,14 +148,17 @@ def getLottoAnalysis() -> LottoAnalysisSnapshotResponse:
     "",
     response_model=LottoAnalysisResponse,
     summary="저장된 회차 기반 통계 분석 결과 갱신",
+    description=_SNAPSHOT_PENDING_DESCRIPTION,
 )
-def postLottoAnalysis() -> LottoAnalysisResponse:
+def postLottoAnalysis(background_tasks: BackgroundTasks) -> ORJSONResponse:
+    pending = _pending_snapshots()
     try:
-        response = refresh_lotto_summary()
+        payload = refresh_lotto_summary(pending=pending)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail={"message": str(exc)}) from exc
 
-    return response
+    background_tasks.add_task(_save_snapshots_after_response, pending)
+    return _snapshot_pending_response(payload)
 
 
 @router.get(
@@ -140,14 +178,17 @@ def getLottoDependencyAnalysis() -> DependencyAnalysisSnapshotResponse:
     "/dependency",
     response_model=DependencyAnalysisResponse,
     summary="연속 회차 의존성 검정 갱신",
+    description=_SNAPSHOT_PENDING_DESCRIPTION,
 )
-def postLottoDependencyAnalysis() -> DependencyAnalysisResponse:
+def postLottoDependencyAnalysis(background_tasks: BackgroundTasks) -> ORJSONResponse:
+    pending = _pending_snapshots()
     try:
-        response = refresh_dependency_analysis()
+        payload = refresh_dependency_analysis(pending=pending)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail={"message": str(exc)}) from exc
 
-    return response
+    background_tasks.add_task(_save_snapshots_after_response, pending)
+    return _snapshot_pending_response(payload)
 
 
 @router.get(
@@ -167,14 +208,17 @@ def getLottoSumRunsTest() -> SumRunsTestSnapshotResponse:
     "/runs/sum",
     response_model=SumRunsTestResponse,
     summary="회차 합계 기반 런 검정 갱신",
+    description=_SNAPSHOT_PENDING_DESCRIPTION,
 )
-def postLottoSumRunsTest() -> SumRunsTestResponse:
+def postLottoSumRunsTest(background_tasks: BackgroundTasks) -> ORJSONResponse:
+    pending = _pending_snapshots()
     try:
-        response = refresh_runs_sum_analysis()
+        payload = refresh_runs_sum_analysis(pending=pending)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail={"message": str(exc)}) from exc
 
-    return response
+    background_tasks.add_task(_save_snapshots_after_response, pending)
+    return _snapshot_pending_response(payload)
 
 
 @router.get(
@@ -194,29 +238,35 @@ def getLottoPatternAnalysis() -> PatternAnalysisSnapshotResponse:
     "/patterns",
     response_model=PatternAnalysisResponse,
     summary="홀짝/저고/끝자리 패턴 검정 갱신",
+    description=_SNAPSHOT_PENDING_DESCRIPTION,
 )
-def postLottoPatternAnalysis() -> PatternAnalysisResponse:
+def postLottoPatternAnalysis(background_tasks: BackgroundTasks) -> ORJSONResponse:
+    pending = _pending_snapshots()
     try:
-        response = refresh_pattern_analysis()
+        payload = refresh_pattern_analysis(pending=pending)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail={"message": str(exc)}) from exc
 
-    return response
+    background_tasks.add_task(_save_snapshots_after_response, pending)
+    return _snapshot_pending_response(payload)
 
 
 @router.post(
     "/distribution",
     response_model=DistributionAnalysisResponse,
     summary="합계/간격 분포 적합도 검정 (POST 전용)",
+    description=_SNAPSHOT_PENDING_DESCRIPTION,
 )
 def postLottoDistributionAnalysis(
+    background_tasks: BackgroundTasks,
     sample_size: int = Query(
         default=100_000,
         ge=10_000,
         le=500_000,
         description="시뮬레이션 샘플 수 (기본 100k)",
     ),
-) -> DistributionAnalysisResponse:
+) -> ORJSONResponse:
+    pending = _pending_snapshots()
     try:
         summary = distribution_summary(sample_size=sample_size)
     except ValueError as exc:
@@ -226,13 +276,11 @@ def postLottoDistributionAnalysis(
         sum=_serialize_distribution_result(summary["sum"]),
         gap=_serialize_distribution_result(summary["gap"]),
     )
+    payload = response.model_dump()
     key = analysis_key("distribution", sample_size=sample_size)
-    _store_snapshot(
-        key,
-        response.model_dump(),
-        metadata={"sample_size": sample_size},
-    )
-    return response
+    pending.append((key, payload, {"sample_size": sample_size}))
+    background_tasks.add_task(_save_snapshots_after_response, pending)
+    return _snapshot_pending_response(payload)
 
 
 @router.get(
@@ -288,8 +336,10 @@ def getLottoRandomnessSuite(
     "/randomness",
     response_model=RandomnessSuiteResponse,
     summary="난수 검정 스위트 갱신",
+    description=_SNAPSHOT_PENDING_DESCRIPTION,
 )
 def postLottoRandomnessSuite(
+    background_tasks: BackgroundTasks,
     encoding: str = Query(
         default="presence",
         description="비트 인코딩 (presence/parity/binary)",
@@ -306,15 +356,20 @@ def postLottoRandomnessSuite(
         le=4,
         description="Serial test block length m",
     ),
-) -> RandomnessSuiteResponse:
+) -> ORJSONResponse:
+    pending = _pending_snapshots()
     try:
-        return refresh_randomness_suite(
+        payload = refresh_randomness_suite(
             encoding=encoding,
             block_size=block_size,
             serial_block=serial_block,
+            pending=pending,
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail={"message": str(exc)}) from exc
 
+    background_tasks.add_task(_save_snapshots_after_response, pending)
+    return _snapshot_pending_response(payload)
+
 
 __all__ = ["router"]
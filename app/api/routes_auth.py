@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -43,14 +44,16 @@ router = APIRouter(prefix="/auth", tags=["auth"])
     summary="신규 사용자 등록",
 )
 async def register_user(payload: UserRegisterRequest) -> UserProfileResponse:
-    user = create_user(
+    # Password hashing and DB writes block; keep them off the event loop.
+    user = await asyncio.to_thread(
+        create_user,
         user_id=payload.userId,
         password=payload.password,
         name=payload.name,
     )
     user_pk = user.get("id")
     if user_pk is not None:
-        token = create_email_verification_token(int(user_pk))
+        token = await asyncio.to_thread(create_email_verification_token, int(user_pk))
         try:
             await send_verification_email(user["userId"], token)
         except Exception:  # noqa: BLE001
@@ -76,8 +79,7 @@ def login(payload: UserLoginRequest) -> TokenPairResponse:
 )
 def refresh_tokens(payload: RefreshTokenRequest) -> TokenPairResponse:
     user = validate_refresh_token(payload.refresh_token)
-    remove_refresh_token(payload.refresh_token)
-    tokens = issue_tokens_for_user(user)
+    tokens = issue_tokens_for_user(user, replaces=payload.refresh_token)
     return TokenPairResponse(**tokens)
 
 
@@ -114,7 +116,10 @@ def verify_email(payload: EmailVerificationRequest) -> MessageResponse:
     summary="이메일 인증 메일 재발송",
 )
 async def resend_verification(payload: ResendVerificationRequest) -> MessageResponse:
-    exists, already_verified, token = resend_verification_token(payload.userId)
+    exists, already_verified, token = await asyncio.to_thread(
+        resend_verification_token,
+        payload.userId,
+    )
 
     if not exists:
         return MessageResponse(
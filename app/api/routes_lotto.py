@@ -7,6 +7,7 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, Path
 
 from app.core.config import get_settings
+from app.core.responses import ORJSONResponse
 from app.models.dto import (
     RecommendationEvaluationRequest,
     RecommendationEvaluationResult,
@@ -24,6 +25,7 @@ from app.services.lotto import (
     evaluate_ticket,
     fetch_draw_info,
     fetch_latest_draw_info,
+    fetch_latest_draw_no,
     get_latest_stored_draw,
     get_stored_draw,
     sync_draw_storage,
@@ -53,17 +55,13 @@ def getLottoLatest(
 ) -> LottoDrawResponse:
     """Return the most recent Lotto draw as published by DhLottery."""
 
+    latest_stored = get_latest_stored_draw()
     try:
-        draw = fetch_latest_draw_info()
+        draw = fetch_latest_draw_info(latest_stored.draw_no if latest_stored else None)
     except ValueError as exc:
         raise HTTPException(status_code=502, detail={"message": str(exc)}) from exc
 
-    return LottoDrawResponse(
-        draw_no=draw.draw_no,
-        draw_date=draw.draw_date,
-        numbers=draw.numbers,
-        bonus=draw.bonus,
-    )
+    return LottoDrawResponse.model_validate(draw)
 
 
 @router.post(
@@ -118,12 +116,7 @@ def getLottoDrawByNumber(
     except ValueError as exc:
         raise HTTPException(status_code=502, detail={"message": str(exc)}) from exc
 
-    return LottoDrawResponse(
-        draw_no=draw.draw_no,
-        draw_date=draw.draw_date,
-        numbers=draw.numbers,
-        bonus=draw.bonus,
-    )
+    return LottoDrawResponse.model_validate(draw)
 
 
 @router.post(
@@ -144,7 +137,7 @@ def postLottoCheck(
 
     if latest_known_no is None:
         try:
-            latest_known_no = fetch_latest_draw_info().draw_no
+            latest_known_no = fetch_latest_draw_no()
         except ValueError:
             latest_known_no = None
 
@@ -208,7 +201,7 @@ def postRecommendationEvaluation(
 )
 def postLottoSync(
     _: dict = Depends(require_access_token),
-) -> LottoSyncResponse:
+) -> ORJSONResponse:
     """Trigger a synchronization run to download missing draw data."""
 
     try:
@@ -216,20 +209,7 @@ def postLottoSync(
     except ValueError as exc:
         raise HTTPException(status_code=502, detail={"message": str(exc)}) from exc
 
-    return LottoSyncResponse(
-        previous_max=result.previous_max,
-        latest=result.latest,
-        inserted=result.inserted,
-        draws=[
-            LottoDrawResponse(
-                draw_no=draw.draw_no,
-                draw_date=draw.draw_date,
-                numbers=draw.numbers,
-                bonus=draw.bonus,
-            )
-            for draw in result.draws
-        ],
-    )
+    return ORJSONResponse(result)
 
 
 __all__ = ["router"]
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
+from app.core.responses import ORJSONResponse
 from app.models.dto import (
     RecommendationBatchResponse,
     RecommendationResponse,
@@ -37,12 +38,12 @@ def getRecommendations(
         default=RecommendationStrategy.random,
         description="추천 전략",
     ),
-) -> RecommendationResponse:
+) -> ORJSONResponse:
     try:
         payload = get_recommendation(strategy.value)
     except RecommendationError as exc:
         raise HTTPException(status_code=400, detail={"message": str(exc)}) from exc
-    return RecommendationResponse(**payload)
+    return ORJSONResponse(payload)
 
 
 @router.post(
@@ -75,14 +76,12 @@ def postRecommendation(
     summary="모든 전략에 대한 추천 결과",
     dependencies=[Depends(require_access_token)],
 )
-def getAllRecommendations() -> RecommendationBatchResponse:
+def getAllRecommendations() -> ORJSONResponse:
     try:
         payload = get_all_recommendations()
     except RecommendationError as exc:
         raise HTTPException(status_code=400, detail={"message": str(exc)}) from exc
-    return RecommendationBatchResponse(
-        recommendations=[RecommendationResponse(**item) for item in payload]
-    )
+    return ORJSONResponse({"recommendations": payload})
 
 
 @router.get(
@@ -90,14 +89,12 @@ def getAllRecommendations() -> RecommendationBatchResponse:
     response_model=RecommendationBatchResponse,
     summary="대시보드용 추천 결과 (상위 3개)",
 )
-def getDashboardRecommendations() -> RecommendationBatchResponse:
+def getDashboardRecommendations() -> ORJSONResponse:
     try:
         payload = get_dashboard_recommendations()
     except RecommendationError as exc:
         raise HTTPException(status_code=400, detail={"message": str(exc)}) from exc
-    return RecommendationBatchResponse(
-        recommendations=[RecommendationResponse(**item) for item in payload]
-    )
+    return ORJSONResponse({"recommendations": payload})
 
 
 __all__ = ["router"]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
 from urllib.parse import quote_plus
 
@@ -54,6 +54,13 @@ class Settings:
     jwt_refresh_token_exp_days: int = int(
         os.getenv("JWT_REFRESH_TOKEN_EXPIRE_DAYS", "14")
     )
+    password_hash_memory_kib: int = int(
+        os.getenv("PASSWORD_HASH_MEMORY_KIB", "19456")
+    )
+    password_hash_time_cost: int = int(os.getenv("PASSWORD_HASH_TIME_COST", "2"))
+    password_hash_parallelism: int = int(
+        os.getenv("PASSWORD_HASH_PARALLELISM", "1")
+    )
     scheduler_timezone: str = os.getenv("LOTTO_SCHEDULER_TZ", "Asia/Seoul")
     scheduler_day_of_week: str = os.getenv("LOTTO_SCHEDULER_DOW", "sat")
     scheduler_hour: int = int(os.getenv("LOTTO_SCHEDULER_HOUR", "21"))
@@ -97,7 +104,7 @@ class Settings:
     def draw_storage_path(self) -> Path:
         return self.data_dir / "lotto_draws.json"
 
-    @property
+    @cached_property
     def allowed_origins(self) -> list[str]:
         return [
             origin.strip()
@@ -105,9 +112,13 @@ class Settings:
             if origin.strip()
         ]
 
-    @property
+    @cached_property
     def use_database_storage(self) -> bool:
-        """Return True when MariaDB/MySQL is configured as the storage backend."""
+        """Return True when MariaDB/MySQL is configured as the storage backend.
+
+        Cached because every storage and auth call consults it; the backend
+        cannot change for the lifetime of a (frozen) settings instance.
+        """
 
         return self.storage_backend.lower() in {
             "mariadb",
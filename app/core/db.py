@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from typing import Generator
+from typing import Any, Generator
 
+import orjson
 from sqlalchemy import create_engine, func, select, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
@@ -18,13 +19,23 @@ class Base(DeclarativeBase):
 
 _engine: Engine | None = None
 _session_factory: sessionmaker | None = None
+_schema_ready = False
 
 
-def _initialize_engine() -> None:
+def _json_serializer(value: Any) -> str:
+    """Encode JSON columns with orjson instead of the stdlib json module."""
+
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
+def _initialize_engine(*, create_schema: bool = True) -> None:
     """Instantiate the singleton engine/session factory if needed."""
 
-    global _engine, _session_factory  # noqa: PLW0603  # module-level cache
+    global _engine, _session_factory, _schema_ready  # noqa: PLW0603  # module-level cache
     if _engine is not None and _session_factory is not None:
+        if create_schema and not _schema_ready:
+            _create_schema(_engine)
+            _schema_ready = True
         return
 
     settings = get_settings()
@@ -38,6 +49,9 @@ def _initialize_engine() -> None:
         settings.mariadb_dsn,
         pool_pre_ping=True,
         future=True,
+        query_cache_size=1200,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
     )
     _engine = engine
     _session_factory = sessionmaker(
@@ -45,6 +59,13 @@ def _initialize_engine() -> None:
         expire_on_commit=False,
         autoflush=False,
     )
+    if create_schema:
+        _create_schema(engine)
+        _schema_ready = True
+
+
+def _create_schema(engine: Engine) -> None:
+    """Create any ORM tables that the SQL bootstrap did not provide."""
 
     # Import models lazily so their metadata is registered before create_all.
     from app import models as _models  # noqa: F401  # ensure metadata registration
@@ -60,6 +81,14 @@ def get_engine() -> Engine:
     return _engine
 
 
+def get_raw_connection():
+    """Check out a pooled DB-API connection without creating the ORM schema."""
+
+    _initialize_engine(create_schema=False)
+    assert _engine is not None
+    return _engine.raw_connection()
+
+
 def get_session() -> Session:
     """Return a transactional Session bound to the global engine."""
 
@@ -97,4 +126,11 @@ def ping_database() -> tuple[bool, int | None]:
     return True, int(total or 0)
 
 
-__all__ = ["Base", "get_engine", "get_session", "session_scope", "ping_database"]
+__all__ = [
+    "Base",
+    "get_engine",
+    "get_raw_connection",
+    "get_session",
+    "session_scope",
+    "ping_database",
+]
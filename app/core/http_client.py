@@ -2,13 +2,41 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from app.core.config import get_settings
 
+# Throttling/5xx responses and failed connects are retried with exponential
+# backoff (a Retry-After header from DhLottery takes precedence). Read
+# timeouts are not retried: a hung endpoint should cost one timeout, not four.
+_RETRY = Retry(
+    total=3,
+    connect=1,
+    read=False,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+
+@lru_cache(maxsize=1)
+def _http_session() -> requests.Session:
+    """Shared session so concurrent fetches reuse pooled keep-alive connections."""
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=16, max_retries=_RETRY)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 def fetch_url(
     url: str,
@@ -25,7 +53,7 @@ def fetch_url(
         **(headers or {}),
     }
 
-    response = requests.get(
+    response = _http_session().get(
         url,
         params=params,
         headers=session_headers,
@@ -0,0 +1,26 @@
+"""Custom FastAPI response classes."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, skipping ``jsonable_encoder``.
+
+    Return it from handlers that already hold plain (``model_dump``-ed) data so
+    FastAPI does not validate and re-encode the payload through the
+    ``response_model`` again.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+
+__all__ = ["ORJSONResponse"]
@@ -3,24 +3,52 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 from app.core.config import get_settings
-from app.services.analysis_tasks import (
-    refresh_dependency_analysis,
-    refresh_lotto_summary,
-    refresh_pattern_analysis,
-    refresh_randomness_suite,
-    refresh_runs_sum_analysis,
-)
+from app.services.analysis_tasks import refresh_all_analyses
+from app.services.auth import purge_expired_refresh_tokens
 from app.services.lotto import sync_draw_storage
 
 logger = logging.getLogger(__name__)
 
 _scheduler: AsyncIOScheduler | None = None
+_TZ_CACHE: dict[str, ZoneInfo] = {}
+
+
+def _tz(name: str) -> ZoneInfo | None:
+    """Return a cached ZoneInfo for ``name`` (None when the key is invalid)."""
+
+    cached = _TZ_CACHE.get(name)
+    if cached is not None:
+        return cached
+    try:
+        zone = ZoneInfo(name)
+    except Exception:  # noqa: BLE001  # caller decides the fallback
+        return None
+    _TZ_CACHE[name] = zone
+    return zone
+
+
+@lru_cache(maxsize=4)
+def _cron_trigger(
+    day_of_week: str,
+    hour: int,
+    minute: int,
+    timezone: ZoneInfo,
+) -> CronTrigger:
+    """Build (once per distinct schedule) the cron trigger for a weekly job."""
+
+    return CronTrigger(
+        day_of_week=day_of_week,
+        hour=hour,
+        minute=minute,
+        timezone=timezone,
+    )
 
 
 def _sync_latest_draws() -> None:
@@ -37,16 +65,22 @@ def _sync_latest_draws() -> None:
         logger.exception("Weekly Lotto sync failed")
 
 
+def _purge_refresh_tokens() -> None:
+    """Drop expired refresh tokens."""
+
+    try:
+        removed = purge_expired_refresh_tokens()
+        logger.info("Expired refresh tokens purged (removed=%s)", removed)
+    except Exception:  # noqa: BLE001
+        logger.exception("Refresh token purge failed")
+
+
 def _refresh_weekly_analysis() -> None:
     """Recompute cached analysis snapshots."""
 
     settings = get_settings()
     try:
-        refresh_lotto_summary()
-        refresh_dependency_analysis()
-        refresh_runs_sum_analysis()
-        refresh_pattern_analysis()
-        refresh_randomness_suite(
+        refresh_all_analyses(
             encoding=settings.analysis_randomness_encoding,
             block_size=settings.analysis_randomness_block_size,
             serial_block=settings.analysis_randomness_serial_block,
@@ -64,21 +98,20 @@ def start_scheduler() -> None:
         return
 
     settings = get_settings()
-    try:
-        timezone = ZoneInfo(settings.scheduler_timezone)
-    except Exception:  # noqa: BLE001  # invalid tz falls back to UTC
+    timezone = _tz(settings.scheduler_timezone)
+    if timezone is None:  # invalid tz falls back to UTC
         logger.warning(
             "Invalid timezone %s, falling back to UTC",
             settings.scheduler_timezone,
         )
-        timezone = ZoneInfo("UTC")
+        timezone = _tz("UTC")
 
     scheduler = AsyncIOScheduler(timezone=timezone)
-    trigger = CronTrigger(
-        day_of_week=settings.scheduler_day_of_week,
-        hour=settings.scheduler_hour,
-        minute=settings.scheduler_minute,
-        timezone=timezone,
+    trigger = _cron_trigger(
+        settings.scheduler_day_of_week,
+        settings.scheduler_hour,
+        settings.scheduler_minute,
+        timezone,
     )
     scheduler.add_job(
         _sync_latest_draws,
@@ -90,9 +123,8 @@ def start_scheduler() -> None:
     )
     if settings.use_database_storage:
         analysis_tz = settings.analysis_scheduler_timezone or settings.scheduler_timezone
-        try:
-            analysis_timezone = ZoneInfo(analysis_tz)
-        except Exception:  # noqa: BLE001
+        analysis_timezone = _tz(analysis_tz)
+        if analysis_timezone is None:
             logger.warning(
                 "Invalid analysis timezone %s, falling back to %s",
                 analysis_tz,
@@ -100,11 +132,11 @@ def start_scheduler() -> None:
             )
             analysis_timezone = timezone
 
-        analysis_trigger = CronTrigger(
-            day_of_week=settings.analysis_scheduler_day_of_week,
-            hour=settings.analysis_scheduler_hour,
-            minute=settings.analysis_scheduler_minute,
-            timezone=analysis_timezone,
+        analysis_trigger = _cron_trigger(
+            settings.analysis_scheduler_day_of_week,
+            settings.analysis_scheduler_hour,
+            settings.analysis_scheduler_minute,
+            analysis_timezone,
         )
         scheduler.add_job(
             _refresh_weekly_analysis,
@@ -121,6 +153,14 @@ def start_scheduler() -> None:
             settings.analysis_scheduler_minute,
             analysis_timezone,
         )
+        scheduler.add_job(
+            _purge_refresh_tokens,
+            trigger=_cron_trigger("*", 4, 0, timezone),
+            id="daily_refresh_token_purge",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+        )
 
     scheduler.start()
     _scheduler = scheduler
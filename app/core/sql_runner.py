@@ -3,26 +3,42 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable
 
-import pymysql
-
 from app.core.config import get_settings
+from app.core.db import get_engine, get_raw_connection
 
 logger = logging.getLogger(__name__)
 
-SQL_FILE_ORDER: tuple[str, ...] = (
-    "lotto_draws.sql",
-    "analysis_snapshots.sql",
-    "users.sql",
-    "users_alter_is_verified.sql",
-    "email_verification_tokens.sql",
-    "users_backfill_is_verified.sql",
-    "refresh_tokens.sql",
-    "user_tickets.sql",
-    "recommendation_snapshots.sql",
-    "user_recommendations.sql",
+# Files inside a stage are independent and run concurrently; stages run in
+# order because later files reference (FK/ALTER/UPDATE) tables created earlier.
+SQL_FILE_STAGES: tuple[tuple[str, ...], ...] = (
+    (
+        "lotto_draws.sql",
+        "analysis_snapshots.sql",
+        "users.sql",
+        "recommendation_snapshots.sql",
+    ),
+    ("users_alter_is_verified.sql",),
+    (
+        "email_verification_tokens.sql",
+        "refresh_tokens.sql",
+        "user_tickets.sql",
+        "user_recommendations.sql",
+    ),
+    (
+        "users_backfill_is_verified.sql",
+        "refresh_tokens_alter_token_hash.sql",
+        "user_recommendations_alter_user_created_index.sql",
+        "user_tickets_alter_user_created_index.sql",
+    ),
+    ("refresh_tokens_purge_unhashed.sql",),
+    ("refresh_tokens_token_hash_not_null.sql",),
+)
+SQL_FILE_ORDER: tuple[str, ...] = tuple(
+    filename for stage in SQL_FILE_STAGES for filename in stage
 )
 
 
@@ -62,26 +78,34 @@ def ensure_database_tables() -> None:
         logger.warning("SQL directory is missing: %s", sql_dir)
         return
 
-    statements = _read_sql_files(sql_dir, SQL_FILE_ORDER)
-    if not statements:
+    stages = [_read_sql_files(sql_dir, stage) for stage in SQL_FILE_STAGES]
+    stages = [stage for stage in stages if stage]
+    if not stages:
         logger.debug("No SQL statements loaded from %s", sql_dir)
-        return
+    else:
+        max_workers = max(len(stage) for stage in stages)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for stage in stages:
+                # list() drains the iterator so errors surface before the next stage.
+                list(executor.map(_execute_sql_file, stage))
+
+    # Run the ORM create_all check now rather than in the first request's session.
+    get_engine()
+
 
-    connection = pymysql.connect(
-        host=settings.mariadb_host,
-        port=settings.mariadb_port,
-        user=settings.mariadb_user,
-        password=settings.mariadb_password,
-        database=settings.mariadb_db_name,
-        autocommit=True,
-        charset="utf8mb4",
-    )
+def _execute_sql_file(entry: tuple[str, str]) -> None:
+    """Run one bootstrap statement on its own pooled connection."""
 
+    filename, statement = entry
+    logger.info("Ensuring table via %s", filename)
+    connection = get_raw_connection()
     try:
-        with connection.cursor() as cursor:
-            for filename, statement in statements:
-                logger.info("Ensuring table via %s", filename)
-                cursor.execute(statement)
+        cursor = connection.cursor()
+        try:
+            cursor.execute(statement)
+        finally:
+            cursor.close()
+        connection.commit()
     finally:
         connection.close()
 
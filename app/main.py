@@ -4,11 +4,13 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.api.routes import router as api_router
 from app.core.config import get_settings
 from app.core.scheduler import start_scheduler, stop_scheduler
 from app.core.sql_runner import ensure_database_tables
+from app.services.email import close_smtp_connection
 
 tags_metadata = [
     {
@@ -30,6 +32,7 @@ tags_metadata = [
     },
 ]
 
+
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     """Ensure necessary tables exist before serving traffic."""
@@ -40,6 +43,7 @@ async def lifespan(_: FastAPI):
         yield
     finally:
         stop_scheduler()
+        close_smtp_connection()
 
 
 app = FastAPI(
@@ -55,11 +59,11 @@ app = FastAPI(
 
 app.include_router(api_router)
 
-settings = get_settings()
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.allowed_origins,
+    allow_origins=get_settings().allowed_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(GZipMiddleware, minimum_size=1024)
@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Dict, List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class HealthResponse(BaseModel):
@@ -12,6 +12,8 @@ class HealthResponse(BaseModel):
 
 
 class LottoDrawResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     draw_no: int = Field(..., description="회차 번호")
     draw_date: str = Field(..., description="추첨 날짜 (YYYY-MM-DD)")
     numbers: List[int] = Field(
@@ -7,6 +7,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     JSON,
     String,
@@ -73,8 +74,9 @@ class RefreshTokenORM(Base):
         nullable=False,
         index=True,
     )
-    token = Column(String(512), nullable=False, unique=True, index=True)
-    expires_at = Column(DateTime, nullable=False)
+    # SHA-256 hex digest of the issued JWT; the token itself is never stored.
+    token_hash = Column(String(64), nullable=False, unique=True, index=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
 
@@ -101,6 +103,11 @@ class UserTicketORM(Base):
         nullable=False,
     )
 
+    __table_args__ = (
+        # Serves the per-user listing ordered by newest first.
+        Index("ix_user_tickets_user_created", "user_id", "created_at"),
+    )
+
 
 class RecommendationSnapshotORM(Base):
     """Cached recommendation results per draw/strategy."""
@@ -155,6 +162,8 @@ class UserRecommendationORM(Base):
             "strategy",
             name="uq_user_draw_strategy",
         ),
+        # Serves the per-user listing ordered by newest first.
+        Index("ix_user_recommendations_user_created", "user_id", "created_at"),
     )
 
 
@@ -2,19 +2,34 @@
 
 from __future__ import annotations
 
-import json
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Tuple
 
-from sqlalchemy import select
+import orjson
+from sqlalchemy import insert, select
 
 from app.core.config import get_settings
 from app.core.db import session_scope
 from app.models.tables import AnalysisSnapshotORM
 from app.services.lotto import get_latest_stored_draw
 
-
-def _require_database_backend() -> None:
+# Analysis results carry int-keyed histograms and may embed numpy scalars.
+_JSON_READY_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+)
+_JSON_SCALARS = (str, int, float, bool, type(None))
+# Plain column rows skip ORM entity construction and identity-map tracking.
+_SNAPSHOT_COLUMNS = (
+    AnalysisSnapshotORM.id,
+    AnalysisSnapshotORM.name,
+    AnalysisSnapshotORM.max_draw_no,
+    AnalysisSnapshotORM.created_at,
+    AnalysisSnapshotORM.result,
+    AnalysisSnapshotORM.metadata_json,
+)
+
+
+def require_database_backend() -> None:
     settings = get_settings()
     if not settings.use_database_storage:
         raise RuntimeError(
@@ -23,10 +38,54 @@ def _require_database_backend() -> None:
         )
 
 
+def _is_json_native(value: Any) -> bool:
+    """Return True when the JSON column can serialize ``value`` unchanged."""
+
+    if isinstance(value, _JSON_SCALARS):
+        return True
+    if isinstance(value, dict):
+        return all(
+            isinstance(key, (str, int)) and _is_json_native(item)
+            for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return all(_is_json_native(item) for item in value)
+    return False
+
+
 def _json_ready(payload: Dict[str, Any]) -> Dict[str, Any]:
     """Ensure payload keys/values are JSON/MariaDB friendly."""
 
-    return json.loads(json.dumps(payload))
+    # model_dump() output is already plain data; only exotic values need the
+    # serialize/parse pass.
+    if _is_json_native(payload):
+        return payload
+    return orjson.loads(orjson.dumps(payload, default=str, option=_JSON_READY_OPTIONS))
+
+
+SnapshotEntry = Tuple[str, Dict[str, Any], Dict[str, Any] | None]
+
+
+def _snapshot_row(
+    name: str,
+    result: Dict[str, Any],
+    metadata: Dict[str, Any] | None,
+    *,
+    max_draw_no: int,
+    created_at: datetime,
+) -> Dict[str, Any]:
+    return {
+        "name": name,
+        "max_draw_no": max_draw_no,
+        "created_at": created_at,
+        "result": _json_ready(result),
+        "metadata_json": _json_ready(metadata or {}),
+    }
+
+
+def _coverage() -> tuple[int, datetime]:
+    latest = get_latest_stored_draw()
+    return (latest.draw_no if latest else 0), datetime.now(timezone.utc)
 
 
 def save_analysis_snapshot(
@@ -36,41 +95,59 @@ def save_analysis_snapshot(
 ) -> str:
     """Store an analysis result document with draw coverage metadata."""
 
-    _require_database_backend()
-    latest = get_latest_stored_draw()
-    document: Dict[str, Any] = {
-        "name": name,
-        "max_draw_no": latest.draw_no if latest else 0,
-        "created_at": datetime.now(timezone.utc),
-        "result": _json_ready(result),
-        "metadata": _json_ready(metadata or {}),
-    }
+    require_database_backend()
+    max_draw_no, created_at = _coverage()
+    row = _snapshot_row(
+        name,
+        result,
+        metadata,
+        max_draw_no=max_draw_no,
+        created_at=created_at,
+    )
 
     with session_scope() as session:
-        record = AnalysisSnapshotORM(
-            name=document["name"],
-            max_draw_no=document["max_draw_no"],
-            created_at=document["created_at"],
-            result=document["result"],
-            metadata_json=document["metadata"],
-        )
+        record = AnalysisSnapshotORM(**row)
         session.add(record)
         session.flush()
         return str(record.id)
 
 
+def save_analysis_snapshots(entries: Iterable[SnapshotEntry]) -> int:
+    """Store several ``(name, result, metadata)`` snapshots in one INSERT."""
+
+    require_database_backend()
+    max_draw_no, created_at = _coverage()
+    rows = [
+        _snapshot_row(
+            name,
+            result,
+            metadata,
+            max_draw_no=max_draw_no,
+            created_at=created_at,
+        )
+        for name, result, metadata in entries
+    ]
+    if not rows:
+        return 0
+
+    with session_scope() as session:
+        session.execute(insert(AnalysisSnapshotORM), rows)
+    return len(rows)
+
+
 def get_latest_analysis_snapshot(name: str) -> Dict[str, Any] | None:
     """Return the newest snapshot for the given analysis name."""
 
-    _require_database_backend()
+    require_database_backend()
     with session_scope() as session:
-        snapshot = session.scalars(
-            select(AnalysisSnapshotORM)
+        snapshot = session.execute(
+            select(*_SNAPSHOT_COLUMNS)
             .where(AnalysisSnapshotORM.name == name)
-            .order_by(
-                AnalysisSnapshotORM.max_draw_no.desc(),
-                AnalysisSnapshotORM.created_at.desc(),
-            )
+            # Snapshots are append-only and draw coverage never shrinks, so
+            # the highest id is the newest; ix_analysis_snapshots_name carries
+            # the primary key and serves this without a filesort.
+            .order_by(AnalysisSnapshotORM.id.desc())
+            .limit(1)
         ).first()
 
     if not snapshot:
@@ -89,4 +166,10 @@ def get_latest_analysis_snapshot(name: str) -> Dict[str, Any] | None:
     }
 
 
-__all__ = ["save_analysis_snapshot", "get_latest_analysis_snapshot"]
+__all__ = [
+    "SnapshotEntry",
+    "require_database_backend",
+    "save_analysis_snapshot",
+    "save_analysis_snapshots",
+    "get_latest_analysis_snapshot",
+]
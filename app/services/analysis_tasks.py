@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from operator import attrgetter
+from typing import Any, Dict, List, Sequence
 
 import logging
 
@@ -13,14 +14,12 @@ from analysis import (
     sum_runs_summary,
     summarize_draws,
 )
-from app.models.dto import (
-    DependencyAnalysisResponse,
-    LottoAnalysisResponse,
-    PatternAnalysisResponse,
-    RandomnessSuiteResponse,
-    SumRunsTestResponse,
+from app.services.analysis_storage import (
+    SnapshotEntry,
+    save_analysis_snapshot,
+    save_analysis_snapshots,
 )
-from app.services.analysis_storage import save_analysis_snapshot
+from app.services.lotto import LottoDraw, load_stored_draws
 
 logger = logging.getLogger(__name__)
 
@@ -28,87 +27,121 @@ logger = logging.getLogger(__name__)
 def analysis_key(base: str, **params: Any) -> str:
     if not params:
         return base
-    suffix = ",".join(f"{key}={params[key]}" for key in sorted(params))
+    suffix = ",".join(f"{key}={value}" for key, value in sorted(params.items()))
     return f"{base}|{suffix}"
 
 
-def _build_lotto_analysis_response(summary: Dict[str, Any]) -> LottoAnalysisResponse:
+# The refresh helpers build the response payloads (shaped like the
+# app.models.dto *Response models) directly: the inputs come from analysis.py,
+# so running them through pydantic only to model_dump() again is wasted work.
+
+
+def _build_lotto_analysis_payload(summary: Dict[str, Any]) -> Dict[str, Any]:
     chi_square = summary["chi_square"]
     runs = summary["runs_test"]
-    return LottoAnalysisResponse(
-        total_draws=summary["total_draws"],
-        chi_square={
+    return {
+        "total_draws": summary["total_draws"],
+        "chi_square": {
             "statistic": chi_square.statistic,
             "p_value": chi_square.p_value,
             "observed": chi_square.observed,
             "expected": chi_square.expected,
         },
-        runs_test={
+        "runs_test": {
             "runs": runs.runs,
             "expected_runs": runs.expected_runs,
             "z_score": runs.z_score,
             "p_value": runs.p_value,
             "total_observations": runs.total_observations,
         },
-        gap_histogram=summary["gap_histogram"],
-        frequency=summary["frequency"],
-    )
+        "gap_histogram": summary["gap_histogram"],
+        "frequency": summary["frequency"],
+    }
+
+
+def _persist(
+    name: str,
+    payload: Dict[str, Any],
+    metadata: Dict[str, Any] | None,
+    pending: List[SnapshotEntry] | None,
+) -> None:
+    """Save now, or queue the snapshot when the caller batches writes."""
+
+    if pending is None:
+        save_analysis_snapshot(name, payload, metadata)
+        logger.info("Analysis snapshot %s saved", name)
+    else:
+        pending.append((name, payload, metadata))
+        logger.info("Analysis snapshot %s queued", name)
+
+
+_PATTERN_FIELDS = ("statistic", "p_value", "observed", "expected")
+_pattern_values = attrgetter(*_PATTERN_FIELDS)
 
 
 def _serialize_pattern_result(result):
-    return {
-        "statistic": result.statistic,
-        "p_value": result.p_value,
-        "observed": result.observed,
-        "expected": result.expected,
-    }
+    return dict(zip(_PATTERN_FIELDS, _pattern_values(result)))
 
 
-def refresh_lotto_summary() -> LottoAnalysisResponse:
+def refresh_lotto_summary(
+    draws: Sequence[LottoDraw] | None = None,
+    *,
+    pending: List[SnapshotEntry] | None = None,
+) -> Dict[str, Any]:
     logger.info("Refreshing lotto summary analysis snapshot...")
-    summary = summarize_draws()
-    response = _build_lotto_analysis_response(summary)
-    save_analysis_snapshot("summary", response.model_dump())
-    logger.info("Lotto summary snapshot updated (total_draws=%s)", response.total_draws)
-    return response
+    payload = _build_lotto_analysis_payload(summarize_draws(draws))
+    _persist("summary", payload, None, pending)
+    logger.info("Lotto summary computed (total_draws=%s)", payload["total_draws"])
+    return payload
 
 
-def refresh_dependency_analysis() -> DependencyAnalysisResponse:
+def refresh_dependency_analysis(
+    draws: Sequence[LottoDraw] | None = None,
+    *,
+    pending: List[SnapshotEntry] | None = None,
+) -> Dict[str, Any]:
     logger.info("Refreshing dependency analysis snapshot...")
-    summary = dependency_summary()
-    response = DependencyAnalysisResponse(**summary)
-    save_analysis_snapshot("dependency", response.model_dump())
-    logger.info("Dependency snapshot updated")
-    return response
+    payload = dependency_summary(draws=draws)
+    _persist("dependency", payload, None, pending)
+    logger.info("Dependency analysis computed")
+    return payload
 
 
-def refresh_runs_sum_analysis() -> SumRunsTestResponse:
+def refresh_runs_sum_analysis(
+    draws: Sequence[LottoDraw] | None = None,
+    *,
+    pending: List[SnapshotEntry] | None = None,
+) -> Dict[str, Any]:
     logger.info("Refreshing sum runs analysis snapshot...")
-    result = sum_runs_summary()
-    response = SumRunsTestResponse(
-        runs=result.runs,
-        expected_runs=result.expected_runs,
-        z_score=result.z_score,
-        p_value=result.p_value,
-        total_observations=result.total_observations,
-        median_threshold=result.median_threshold,
-    )
-    save_analysis_snapshot("runs_sum", response.model_dump())
-    logger.info("Sum runs snapshot updated (runs=%s)", response.runs)
-    return response
+    result = sum_runs_summary(draws)
+    payload = {
+        "runs": result.runs,
+        "expected_runs": result.expected_runs,
+        "z_score": result.z_score,
+        "p_value": result.p_value,
+        "total_observations": result.total_observations,
+        "median_threshold": result.median_threshold,
+    }
+    _persist("runs_sum", payload, None, pending)
+    logger.info("Sum runs analysis computed (runs=%s)", result.runs)
+    return payload
 
 
-def refresh_pattern_analysis() -> PatternAnalysisResponse:
+def refresh_pattern_analysis(
+    draws: Sequence[LottoDraw] | None = None,
+    *,
+    pending: List[SnapshotEntry] | None = None,
+) -> Dict[str, Any]:
     logger.info("Refreshing pattern analysis snapshot...")
-    summary = pattern_analysis_summary()
-    response = PatternAnalysisResponse(
-        parity=_serialize_pattern_result(summary["parity"]),
-        low_high=_serialize_pattern_result(summary["low_high"]),
-        last_digit=_serialize_pattern_result(summary["last_digit"]),
-    )
-    save_analysis_snapshot("patterns", response.model_dump())
-    logger.info("Pattern analysis snapshot updated")
-    return response
+    summary = pattern_analysis_summary(draws)
+    payload = {
+        "parity": _serialize_pattern_result(summary["parity"]),
+        "low_high": _serialize_pattern_result(summary["low_high"]),
+        "last_digit": _serialize_pattern_result(summary["last_digit"]),
+    }
+    _persist("patterns", payload, None, pending)
+    logger.info("Pattern analysis computed")
+    return payload
 
 
 def refresh_randomness_suite(
@@ -116,40 +149,76 @@ def refresh_randomness_suite(
     encoding: str,
     block_size: int,
     serial_block: int,
-) -> RandomnessSuiteResponse:
+    draws: Sequence[LottoDraw] | None = None,
+    pending: List[SnapshotEntry] | None = None,
+) -> Dict[str, Any]:
     logger.info(
         "Refreshing randomness suite snapshot (encoding=%s block=%s serial=%s)...",
         encoding,
         block_size,
         serial_block,
     )
-    summary = randomness_suite_summary(
+    payload = randomness_suite_summary(
         encoding=encoding,
         block_size=block_size,
         serial_block=serial_block,
+        draws=draws,
     )
-    response = RandomnessSuiteResponse(**summary)
     key = analysis_key(
         "randomness",
         encoding=encoding,
         block_size=block_size,
         serial_block=serial_block,
     )
-    save_analysis_snapshot(
+    _persist(
         key,
-        response.model_dump(),
-        metadata={
+        payload,
+        {
             "encoding": encoding,
             "block_size": block_size,
             "serial_block": serial_block,
         },
+        pending,
     )
-    logger.info("Randomness suite snapshot updated")
-    return response
+    logger.info("Randomness suite computed")
+    return payload
+
+
+def refresh_all_analyses(
+    *,
+    encoding: str,
+    block_size: int,
+    serial_block: int,
+) -> None:
+    """Refresh every cached analysis snapshot from a single draw load.
+
+    The snapshots are written together in one INSERT; if a later analysis
+    fails, the ones already computed are still saved before the error
+    propagates.
+    """
+
+    draws = load_stored_draws()
+    pending: List[SnapshotEntry] = []
+    try:
+        refresh_lotto_summary(draws, pending=pending)
+        refresh_dependency_analysis(draws, pending=pending)
+        refresh_runs_sum_analysis(draws, pending=pending)
+        refresh_pattern_analysis(draws, pending=pending)
+        refresh_randomness_suite(
+            encoding=encoding,
+            block_size=block_size,
+            serial_block=serial_block,
+            draws=draws,
+            pending=pending,
+        )
+    finally:
+        saved = save_analysis_snapshots(pending)
+        logger.info("Saved %s analysis snapshots", saved)
 
 
 __all__ = [
     "analysis_key",
+    "refresh_all_analyses",
     "refresh_dependency_analysis",
     "refresh_lotto_summary",
     "refresh_pattern_analysis",
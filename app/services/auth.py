@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+import hashlib
 import secrets
-from typing import Any, Dict, Optional
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from argon2 import PasswordHasher, Type as Argon2Type
+from argon2.exceptions import InvalidHashError, VerificationError
 from passlib.context import CryptContext
-from sqlalchemy import delete, select
+from sqlalchemy import delete, exists, select, update
+from sqlalchemy.exc import IntegrityError
 
 from app.core.config import get_settings
 from app.core.db import session_scope
@@ -25,8 +33,111 @@ class EmailVerificationError(ValueError):
     """Raised when email verification fails."""
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+MAX_REFRESH_TOKENS_PER_USER = 10
+
+
+@lru_cache(maxsize=1)
+def _password_hasher() -> PasswordHasher:
+    """argon2id hasher used directly for new hashes and the login hot path."""
+
+    settings = get_settings()
+    return PasswordHasher(
+        time_cost=settings.password_hash_time_cost,
+        memory_cost=settings.password_hash_memory_kib,
+        parallelism=settings.password_hash_parallelism,
+        type=Argon2Type.ID,
+    )
+
+
+# Only consulted for legacy bcrypt hashes, which are rehashed on next login.
+_legacy_password_context = CryptContext(schemes=["bcrypt"])
+
+
 oauth2_scheme = HTTPBearer(auto_error=False)
+# One codec with the required claims merged into its default options, so
+# decode() does not rebuild the options dict per call.
+_jwt_codec = jwt.PyJWT(options={"require": ["exp", "sub", "type"]})
+
+
+@dataclass(frozen=True)
+class _TokenSettings:
+    """JWT parameters derived once from :class:`Settings`."""
+
+    secret_key: Any
+    algorithm: str
+    algorithms: List[str]
+    access_ttl: timedelta
+    refresh_ttl: timedelta
+    expires_in: int
+    refresh_expires_in: int
+
+
+@lru_cache(maxsize=1)
+def _token_settings() -> _TokenSettings:
+    settings = get_settings()
+    access_ttl = timedelta(minutes=settings.jwt_access_token_exp_minutes)
+    refresh_ttl = timedelta(days=settings.jwt_refresh_token_exp_days)
+    # Prepare the key once (bytes for HMAC) so PyJWT's per-call
+    # prepare_key() only has to pass it through.
+    signing_key = jwt.get_algorithm_by_name(settings.jwt_algorithm).prepare_key(
+        settings.jwt_secret_key
+    )
+    return _TokenSettings(
+        secret_key=signing_key,
+        algorithm=settings.jwt_algorithm,
+        algorithms=[settings.jwt_algorithm],
+        access_ttl=access_ttl,
+        refresh_ttl=refresh_ttl,
+        expires_in=int(access_ttl.total_seconds()),
+        refresh_expires_in=int(refresh_ttl.total_seconds()),
+    )
+
+
+# Access token digest -> (monotonic deadline, authenticated user). Entries
+# live for at most _AUTH_CACHE_TTL seconds and never past the token's "exp".
+_AUTH_CACHE_TTL = 60.0
+_AUTH_CACHE_MAX = 10_000
+_auth_cache: Dict[bytes, Tuple[float, Dict[str, Any]]] = {}
+_auth_cache_lock = threading.Lock()
+
+
+def _auth_cache_key(token: str) -> bytes:
+    # 16-byte keys bound memory regardless of the JWT's length.
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+
+def _cached_user(key: bytes) -> Optional[Dict[str, Any]]:
+    entry = _auth_cache.get(key)
+    if entry is None:
+        return None
+    deadline, user = entry
+    if deadline <= time.monotonic():
+        with _auth_cache_lock:
+            _auth_cache.pop(key, None)
+        return None
+    # Hand out copies so one request cannot alter another's view of the user.
+    return dict(user)
+
+
+def _cache_user(key: bytes, payload: Dict[str, Any], user: Dict[str, Any]) -> None:
+    now = time.monotonic()
+    ttl = min(_AUTH_CACHE_TTL, float(payload["exp"]) - time.time())
+    if ttl <= 0:
+        return
+    with _auth_cache_lock:
+        if len(_auth_cache) >= _AUTH_CACHE_MAX:
+            _auth_cache.pop(next(iter(_auth_cache)))
+        _auth_cache[key] = (now + ttl, dict(user))
+
+
+def _evict_cached_user(user_id: str) -> None:
+    with _auth_cache_lock:
+        for key in [
+            key
+            for key, (_, user) in _auth_cache.items()
+            if user["user_id"] == user_id
+        ]:
+            del _auth_cache[key]
 
 
 def _ensure_database_backend() -> None:
@@ -45,56 +156,97 @@ def _user_to_dict(record: UserORM) -> Dict[str, Any]:
     }
 
 
+# Columns needed once a caller is authenticated; password_hash is left out.
+_PROFILE_COLUMNS = (
+    UserORM.id,
+    UserORM.user_id,
+    UserORM.is_verified,
+    UserORM.name,
+    UserORM.created_at,
+)
+
+
+def _profile_to_dict(row: Any) -> Dict[str, Any]:
+    return {
+        "id": row.id,
+        "user_id": row.user_id,
+        "is_verified": bool(row.is_verified),
+        "name": row.name,
+        "created_at": row.created_at,
+    }
+
+
+def _is_argon2_hash(hashed: str) -> bool:
+    return hashed.startswith("$argon2")
+
+
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return _password_hasher().hash(password)
 
 
 def verify_password(plain: str, hashed: str) -> bool:
-    return pwd_context.verify(plain, hashed)
+    if not _is_argon2_hash(hashed):
+        return _legacy_password_context.verify(plain, hashed)
+    try:
+        return _password_hasher().verify(hashed, plain)
+    except (VerificationError, InvalidHashError):
+        return False
 
 
-def _token_payload(user_id: str) -> Dict[str, Any]:
-    return {"sub": user_id}
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    return hash_password(secrets.token_urlsafe(16))
 
 
-def create_access_token(user_id: str) -> str:
-    settings = get_settings()
-    expire = datetime.now(timezone.utc) + timedelta(
-        minutes=settings.jwt_access_token_exp_minutes
-    )
-    payload = {
-        **_token_payload(user_id),
-        "exp": expire,
-        "type": "access",
-    }
-    return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+def _password_needs_rehash(hashed: str) -> bool:
+    """True for legacy hashes and for argon2 hashes with outdated parameters.
 
+    Changing the PASSWORD_HASH_* cost settings therefore upgrades existing
+    hashes on the next login.
+    """
 
-def create_refresh_token(user_id: str) -> Dict[str, Any]:
-    settings = get_settings()
-    expire = datetime.now(timezone.utc) + timedelta(
-        days=settings.jwt_refresh_token_exp_days
-    )
+    if not _is_argon2_hash(hashed):
+        return True
+    try:
+        return _password_hasher().check_needs_rehash(hashed)
+    except InvalidHashError:
+        return True
+
+
+def create_access_token(user_id: str, *, now: datetime | None = None) -> str:
+    token_settings = _token_settings()
+    issued_at = now or datetime.now(timezone.utc)
     payload = {
-        **_token_payload(user_id),
-        "exp": expire,
-        "type": "refresh",
+        "sub": user_id,
+        "exp": issued_at + token_settings.access_ttl,
+        "type": "access",
     }
-    token = jwt.encode(
+    return _jwt_codec.encode(
         payload,
-        settings.jwt_secret_key,
-        algorithm=settings.jwt_algorithm,
+        token_settings.secret_key,
+        algorithm=token_settings.algorithm,
     )
-    return {"token": token, "expires_at": expire}
+
+
+def create_refresh_token(*, now: datetime | None = None) -> Dict[str, Any]:
+    """Issue an opaque refresh token.
+
+    Refresh tokens are only ever checked against their stored hash, so a
+    signed JWT would add nothing; a random value keeps every token unique
+    even when several are issued within the same second.
+    """
+
+    expire = (now or datetime.now(timezone.utc)) + _token_settings().refresh_ttl
+    return {"token": secrets.token_urlsafe(48), "expires_at": expire}
 
 
 def decode_token(token: str, expected_type: str = "access") -> Dict[str, Any]:
-    settings = get_settings()
+    token_settings = _token_settings()
     try:
-        payload = jwt.decode(
+        payload = _jwt_codec.decode(
             token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm],
+            token_settings.secret_key,
+            algorithms=token_settings.algorithms,
         )
     except jwt.ExpiredSignatureError as exc:
         raise HTTPException(
@@ -129,25 +281,35 @@ def user_profile(document: Dict[str, Any]) -> Dict[str, Any]:
 
 def create_user(user_id: str, password: str, name: str) -> Dict[str, Any]:
     _ensure_database_backend()
+    # Cheap indexed probe so a taken id is rejected before paying for argon2.
     with session_scope() as session:
-        existing = session.scalars(
-            select(UserORM).where(UserORM.user_id == user_id)
-        ).first()
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="이미 존재하는 사용자 ID입니다.",
-            )
+        taken = session.scalar(
+            select(exists().where(UserORM.user_id == user_id))
+        )
+    if taken:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 존재하는 사용자 ID입니다.",
+        )
 
+    password_hash = hash_password(password)
+    with session_scope() as session:
         record = UserORM(
             user_id=user_id,
-            password_hash=hash_password(password),
+            password_hash=password_hash,
             is_verified=False,
             name=name,
             created_at=datetime.now(timezone.utc),
         )
         session.add(record)
-        session.flush()
+        # The unique key on users.user_id still catches a concurrent signup.
+        try:
+            session.flush()
+        except IntegrityError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="이미 존재하는 사용자 ID입니다.",
+            ) from exc
         document = _user_to_dict(record)
     return _serialize_user(document)
 
@@ -159,7 +321,11 @@ def authenticate_user(user_id: str, password: str) -> Dict[str, Any]:
             select(UserORM).where(UserORM.user_id == user_id)
         ).first()
 
-    if not record or not verify_password(password, record.password_hash):
+    if record is None:
+        # Burn the same argon2 work as a real check so response time does not
+        # reveal whether the user id exists.
+        verify_password(password, _dummy_password_hash())
+    if record is None or not verify_password(password, record.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="사용자 ID 또는 비밀번호가 올바르지 않습니다.",
@@ -170,27 +336,87 @@ def authenticate_user(user_id: str, password: str) -> Dict[str, Any]:
             status_code=status.HTTP_403_FORBIDDEN,
             detail="이메일이 아직 인증되지 않았습니다. 이메일 인증 후 로그인해주세요.",
         )
+    if _password_needs_rehash(record.password_hash):
+        _rehash_password(record, password)
     return _user_to_dict(record)
 
 
-def store_refresh_token(user_id: str, token: str, expires_at: datetime) -> None:
+def _rehash_password(record: UserORM, password: str) -> None:
+    """Upgrade a legacy (bcrypt) hash to the current scheme."""
+
+    password_hash = hash_password(password)
+    with session_scope() as session:
+        session.execute(
+            update(UserORM)
+            .where(UserORM.id == record.id)
+            .values(password_hash=password_hash)
+        )
+    record.password_hash = password_hash
+
+
+def _hash_refresh_token(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def store_refresh_token(
+    user_id: str,
+    token: str,
+    expires_at: datetime,
+    *,
+    now: datetime | None = None,
+    replaces: str | None = None,
+) -> None:
+    """Store a refresh token, optionally revoking ``replaces`` in the same commit."""
+
     _ensure_database_backend()
+    now = now or datetime.now(timezone.utc)
     with session_scope() as session:
+        if replaces is not None:
+            revoked = session.execute(
+                delete(RefreshTokenORM).where(
+                    RefreshTokenORM.token_hash == _hash_refresh_token(replaces)
+                )
+            )
+            # A concurrent refresh already rotated this token out; refusing
+            # here (and rolling back) keeps a refresh token single-use.
+            if revoked.rowcount != 1:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="등록되지 않은 리프레시 토큰입니다.",
+                )
         session.add(
             RefreshTokenORM(
                 user_id=user_id,
-                token=token,
+                token_hash=_hash_refresh_token(token),
                 expires_at=expires_at,
-                created_at=datetime.now(timezone.utc),
+                created_at=now,
             )
         )
+        session.flush()
+        # Keep only the newest sessions per user; older ones are signed out.
+        oldest_kept = session.scalar(
+            select(RefreshTokenORM.id)
+            .where(RefreshTokenORM.user_id == user_id)
+            .order_by(RefreshTokenORM.id.desc())
+            .offset(MAX_REFRESH_TOKENS_PER_USER - 1)
+            .limit(1)
+        )
+        if oldest_kept is not None:
+            session.execute(
+                delete(RefreshTokenORM).where(
+                    RefreshTokenORM.user_id == user_id,
+                    RefreshTokenORM.id < oldest_kept,
+                )
+            )
 
 
 def remove_refresh_token(token: str) -> None:
     _ensure_database_backend()
     with session_scope() as session:
         session.execute(
-            delete(RefreshTokenORM).where(RefreshTokenORM.token == token)
+            delete(RefreshTokenORM).where(
+                RefreshTokenORM.token_hash == _hash_refresh_token(token)
+            )
         )
 
 
@@ -198,49 +424,78 @@ def find_user_by_refresh_token(token: str) -> Optional[Dict[str, Any]]:
     _ensure_database_backend()
     with session_scope() as session:
         row = session.execute(
-            select(UserORM, RefreshTokenORM)
+            select(*_PROFILE_COLUMNS, RefreshTokenORM.expires_at)
             .join(
                 RefreshTokenORM,
                 RefreshTokenORM.user_id == UserORM.user_id,
             )
-            .where(RefreshTokenORM.token == token)
+            .where(
+                RefreshTokenORM.token_hash == _hash_refresh_token(token),
+                RefreshTokenORM.expires_at > datetime.now(timezone.utc),
+            )
         ).first()
 
     if not row:
         return None
 
-    user, refresh = row
-    document = _user_to_dict(user)
-    document["refresh_tokens"] = [
-        {"token": refresh.token, "expires_at": refresh.expires_at}
-    ]
+    document = _profile_to_dict(row)
+    document["refresh_tokens"] = [{"token": token, "expires_at": row.expires_at}]
     return document
 
 
+def purge_expired_refresh_tokens() -> int:
+    """Delete refresh tokens past their expiry (MariaDB has no TTL index)."""
+
+    _ensure_database_backend()
+    with session_scope() as session:
+        result = session.execute(
+            delete(RefreshTokenORM).where(
+                RefreshTokenORM.expires_at <= datetime.now(timezone.utc)
+            )
+        )
+    return int(result.rowcount or 0)
+
+
 def revoke_all_refresh_tokens(user_id: str) -> None:
     _ensure_database_backend()
     with session_scope() as session:
         session.execute(
             delete(RefreshTokenORM).where(RefreshTokenORM.user_id == user_id)
         )
+    _evict_cached_user(user_id)
 
 
-def issue_tokens_for_user(user: Dict[str, Any]) -> Dict[str, Any]:
+def issue_tokens_for_user(
+    user: Dict[str, Any],
+    *,
+    replaces: str | None = None,
+) -> Dict[str, Any]:
+    """Issue a token pair; ``replaces`` is a refresh token rotated out atomically."""
+
     if not user.get("is_verified"):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="이메일이 아직 인증되지 않았습니다. 이메일 인증 후 로그인해주세요.",
         )
-    access_token = create_access_token(user["user_id"])
-    refresh = create_refresh_token(user["user_id"])
-    store_refresh_token(user["user_id"], refresh["token"], refresh["expires_at"])
+    token_settings = _token_settings()
+    user_id = user["user_id"]
+    now = datetime.now(timezone.utc)
+    access_token = create_access_token(user_id, now=now)
+    refresh = create_refresh_token(now=now)
+    store_refresh_token(
+        user_id,
+        refresh["token"],
+        refresh["expires_at"],
+        now=now,
+        replaces=replaces,
+    )
 
     return {
         "access_token": access_token,
         "refresh_token": refresh["token"],
         "token_type": "Bearer",
-        "expires_in": get_settings().jwt_access_token_exp_minutes * 60,
-        "refresh_expires_in": get_settings().jwt_refresh_token_exp_days * 24 * 3600,
+        "expires_in": token_settings.expires_in,
+        "refresh_expires_in": token_settings.refresh_expires_in,
         "user": _serialize_user(user),
     }
 
@@ -252,19 +507,27 @@ def get_current_user(credentials: HTTPAuthorizationCredentials | None) -> Dict[s
             detail="인증 정보가 제공되지 않았습니다.",
         )
 
-    payload = decode_token(credentials.credentials, expected_type="access")
+    token = credentials.credentials
+    cache_key = _auth_cache_key(token)
+    cached = _cached_user(cache_key)
+    if cached is not None:
+        return cached
+
+    payload = decode_token(token, expected_type="access")
     user_id = payload["sub"]
     _ensure_database_backend()
     with session_scope() as session:
-        record = session.scalars(
-            select(UserORM).where(UserORM.user_id == user_id)
+        row = session.execute(
+            select(*_PROFILE_COLUMNS).where(UserORM.user_id == user_id)
         ).first()
-    if not record:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="사용자를 찾을 수 없습니다.",
         )
-    return _user_to_dict(record)
+    user = _profile_to_dict(row)
+    _cache_user(cache_key, payload, user)
+    return user
 
 
 def _upsert_email_token(
@@ -333,6 +596,8 @@ def verify_email_token(token: str) -> Dict[str, Any]:
         record.used = True
         session.flush()
         document = _user_to_dict(user)
+    # Cached profiles would keep reporting the user as unverified until expiry.
+    _evict_cached_user(document["user_id"])
     return document
 
 
@@ -345,8 +610,10 @@ def resend_verification_token(user_id: str) -> tuple[bool, bool, str | None]:
         minutes=settings.email_verification_exp_minutes
     )
     with session_scope() as session:
-        user = session.scalars(
-            select(UserORM).where(UserORM.user_id == user_id)
+        user = session.execute(
+            select(UserORM.id, UserORM.is_verified)
+            .where(UserORM.user_id == user_id)
+            .limit(1)
         ).first()
         if not user:
             return False, False, None
@@ -367,7 +634,6 @@ def require_access_token(
 
 
 def validate_refresh_token(token: str) -> Dict[str, Any]:
-    payload = decode_token(token, expected_type="refresh")
     user = find_user_by_refresh_token(token)
     if not user:
         raise HTTPException(
@@ -375,28 +641,7 @@ def validate_refresh_token(token: str) -> Dict[str, Any]:
             detail="등록되지 않은 리프레시 토큰입니다.",
         )
 
-    match = next(
-        (
-            entry
-            for entry in user.get("refresh_tokens", [])
-            if entry.get("token") == token
-        ),
-        None,
-    )
-    if not match:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="등록되지 않은 리프레시 토큰입니다.",
-        )
-
-    expires_at = match.get("expires_at")
-    if isinstance(expires_at, datetime) and expires_at < datetime.now(timezone.utc):
-        remove_refresh_token(token)
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="리프레시 토큰이 만료되었습니다.",
-        )
-
+    # Expired rows are filtered out by the lookup and purged by the scheduler.
     return user
 
 
@@ -406,6 +651,7 @@ __all__ = [
     "issue_tokens_for_user",
     "find_user_by_refresh_token",
     "remove_refresh_token",
+    "purge_expired_refresh_tokens",
     "decode_token",
     "get_current_user",
     "validate_refresh_token",
@@ -4,52 +4,149 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import queue
 import smtplib
+import string
+import time
 from email.message import EmailMessage
+from functools import lru_cache
 
 from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
 
-def _build_verification_email(to_email: str, token: str) -> EmailMessage:
-    settings = get_settings()
-    frontend = settings.frontend_host.rstrip("/")
-    verification_url = f"{frontend}/auth/verify?token={token}"
-    subject = "Verify your Lotto Insec account"
-
-    body = (
-        "안녕하세요!\n\n"
-        "Lotto Insec 계정을 활성화하려면 아래 링크를 눌러 이메일을 인증해주세요:\n\n"
-        f"{verification_url}\n\n"
-        "이 링크는 1시간 후 만료됩니다. 만약 본인이 요청하지 않았다면 이 메일을 무시하세요.\n\n"
-        "감사합니다."
-    )
+_VERIFICATION_SUBJECT = "Verify your Lotto Insec account"
+_VERIFICATION_BODY = string.Template(
+    "안녕하세요!\n\n"
+    "Lotto Insec 계정을 활성화하려면 아래 링크를 눌러 이메일을 인증해주세요:\n\n"
+    "${url}\n\n"
+    "이 링크는 1시간 후 만료됩니다. 만약 본인이 요청하지 않았다면 이 메일을 무시하세요.\n\n"
+    "감사합니다."
+)
+
+
+@lru_cache(maxsize=1)
+def _verification_url_prefix() -> str:
+    frontend = get_settings().frontend_host.rstrip("/")
+    return f"{frontend}/auth/verify?token="
 
+
+def _build_verification_email(to_email: str, token: str) -> EmailMessage:
     message = EmailMessage()
-    message["Subject"] = subject
-    message["From"] = settings.email_from
+    message["Subject"] = _VERIFICATION_SUBJECT
+    message["From"] = get_settings().email_from
     message["To"] = to_email
-    message.set_content(body)
+    message.set_content(
+        _VERIFICATION_BODY.substitute(url=_verification_url_prefix() + token)
+    )
     return message
 
 
-def _send_email(message: EmailMessage) -> None:
-    settings = get_settings()
-    if not settings.email_host:
-        logger.warning("EMAIL_HOST is not configured; skipping email send.")
-        return
+# Idle SMTP sessions as (last used, monotonic) pairs. Each send checks one
+# out and uses it without holding any lock, so sends still run in parallel;
+# LIFO keeps the most recently used (most likely alive) session on top.
+_SMTP_POOL_SIZE = 4
+# Sessions idle for longer than this are probed with NOOP before reuse;
+# fresher ones rely on the SMTPServerDisconnected retry instead.
+_SMTP_PROBE_AFTER_SECONDS = 30.0
+_smtp_pool: queue.LifoQueue[tuple[float, smtplib.SMTP]] = queue.LifoQueue(
+    maxsize=_SMTP_POOL_SIZE
+)
 
-    with smtplib.SMTP(
+
+def _open_smtp_connection() -> smtplib.SMTP:
+    settings = get_settings()
+    server = smtplib.SMTP(
         host=settings.email_host,
         port=settings.email_port,
         timeout=settings.email_timeout,
-    ) as server:
+    )
+    try:
         if settings.email_use_tls:
             server.starttls()
         if settings.email_user:
             server.login(settings.email_user, settings.email_password)
-        server.send_message(message)
+    except Exception:
+        server.close()
+        raise
+    return server
+
+
+def _close_smtp(server: smtplib.SMTP) -> None:
+    try:
+        server.quit()
+    except (smtplib.SMTPException, OSError):
+        server.close()
+
+
+def _smtp_connection_alive(server: smtplib.SMTP) -> bool:
+    try:
+        return server.noop()[0] == 250
+    except (smtplib.SMTPException, OSError):
+        return False
+
+
+def _checkout_smtp_connection() -> smtplib.SMTP:
+    while True:
+        try:
+            last_used, server = _smtp_pool.get_nowait()
+        except queue.Empty:
+            return _open_smtp_connection()
+        if time.monotonic() - last_used < _SMTP_PROBE_AFTER_SECONDS:
+            return server
+        if _smtp_connection_alive(server):
+            return server
+        _close_smtp(server)
+
+
+def _release_smtp_connection(server: smtplib.SMTP) -> None:
+    try:
+        _smtp_pool.put_nowait((time.monotonic(), server))
+    except queue.Full:
+        _close_smtp(server)
+
+
+def _send_email(message: EmailMessage) -> None:
+    """Send ``message`` over a pooled SMTP session, reconnecting when stale.
+
+    The TLS handshake and login dominate send latency, so sessions are kept
+    open between emails and reused.
+    """
+
+    settings = get_settings()
+    if not settings.email_host:
+        logger.warning("EMAIL_HOST is not configured; skipping email send.")
+        return
+
+    server = _checkout_smtp_connection()
+    try:
+        try:
+            server.send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            # The server dropped an idle session; retry once on a new one.
+            server.close()
+            server = _open_smtp_connection()
+            server.send_message(message)
+    except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused):
+        # The session is still usable; smtplib already reset the transaction.
+        _release_smtp_connection(server)
+        raise
+    except Exception:
+        server.close()
+        raise
+    _release_smtp_connection(server)
+
+
+def close_smtp_connection() -> None:
+    """Close the pooled SMTP sessions, if any (called on app shutdown)."""
+
+    while True:
+        try:
+            _, server = _smtp_pool.get_nowait()
+        except queue.Empty:
+            return
+        _close_smtp(server)
 
 
 async def send_verification_email(to_email: str, token: str) -> None:
@@ -68,4 +165,4 @@ async def send_verification_email(to_email: str, token: str) -> None:
         logger.exception("Failed to send verification email to %s", to_email)
 
 
-__all__ = ["send_verification_email"]
+__all__ = ["close_smtp_connection", "send_verification_email"]
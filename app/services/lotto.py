@@ -2,21 +2,45 @@
 
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
+import os
+import re
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, List
 
-from bs4 import BeautifulSoup
-from sqlalchemy import desc, select
+import orjson
+from sqlalchemy import desc, func, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 
 from app.core.config import get_settings
 from app.core.db import session_scope
 from app.core.http_client import fetch_text, fetch_url
 from app.models.tables import LottoDrawORM
 
+_DRAW_SELECT_RE = re.compile(
+    r"<select\b[^>]*\bid=[\"']?dwrNoList\b[^>]*>(.*?)</select>",
+    re.IGNORECASE | re.DOTALL,
+)
+_OPTION_VALUE_RE = re.compile(
+    r"<option\b[^>]*\bvalue=[\"']?(\d+)(?=[\"'\s>])",
+    re.IGNORECASE,
+)
 
-@dataclass
+# Upper bound on concurrent DhLottery requests while back-filling draws.
+_SYNC_FETCH_WORKERS = 8
+# Rows per INSERT ... ON DUPLICATE KEY UPDATE when saving draws to MariaDB.
+_DRAW_UPSERT_BATCH_SIZE = 500
+
+
+class DrawNotPublishedError(ValueError):
+    """Raised when DhLottery reports a draw as not (yet) available."""
+
+
+@dataclass(slots=True, frozen=True)
 class LottoDraw:
     """Container holding the essential facts for a lotto drawing."""
 
@@ -26,7 +50,7 @@ class LottoDraw:
     bonus: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LottoSyncResult:
     """Summary of a synchronization run against DhLottery."""
 
@@ -41,30 +65,24 @@ def _draw_file() -> Path:
 
 
 def _deduplicate_draws(draws: List[LottoDraw]) -> List[LottoDraw]:
-    dedup: Dict[int, LottoDraw] = {}
-    for draw in sorted(draws, key=lambda d: d.draw_no):
-        dedup[draw.draw_no] = draw
-    return list(dedup.values())
+    # Sync passes already-sorted stored draws followed by newer ones, so the
+    # common case needs only this linear check.
+    if all(prev.draw_no < curr.draw_no for prev, curr in zip(draws, draws[1:])):
+        return list(draws)
+
+    # Later occurrences win, then a single sort over the unique draws.
+    dedup: Dict[int, LottoDraw] = {draw.draw_no: draw for draw in draws}
+    return sorted(dedup.values(), key=attrgetter("draw_no"))
 
 
 def _extract_latest_draw_number(html: str) -> int:
     """Parse the DhLottery `byWin` page for the newest draw number."""
 
-    soup = BeautifulSoup(html, "html.parser")
-    select = soup.find("select", id="dwrNoList")
+    select = _DRAW_SELECT_RE.search(html)
     if not select:
         raise ValueError("Could not find select#dwrNoList in response HTML.")
 
-    latest: int | None = None
-    for option in select.find_all("option"):
-        value = option.get("value")
-        if not value or not value.isdigit():
-            continue
-
-        draw_number = int(value)
-        if latest is None or draw_number > latest:
-            latest = draw_number
-
+    latest = max(map(int, _OPTION_VALUE_RE.findall(select.group(1))), default=None)
     if latest is None:
         raise ValueError("No numeric draw numbers found in select#dwrNoList.")
 
@@ -109,25 +127,36 @@ def _load_draws_from_file() -> List[LottoDraw]:
     if not draw_path.exists():
         return []
 
-    data = json.loads(draw_path.read_text())
+    data = orjson.loads(draw_path.read_bytes())
     draws = [_dict_to_draw(item) for item in data]
-    return sorted(draws, key=lambda draw: draw.draw_no)
+    return sorted(draws, key=attrgetter("draw_no"))
+
+
+# Only the columns LottoDraw needs; skips the audit timestamps and ORM
+# identity-map bookkeeping when reading draws back.
+_DRAW_COLUMNS = (
+    LottoDrawORM.draw_no,
+    LottoDrawORM.draw_date,
+    LottoDrawORM.numbers,
+    LottoDrawORM.bonus,
+)
+
+
+def _row_to_draw(row) -> LottoDraw:
+    return LottoDraw(
+        draw_no=row.draw_no,
+        draw_date=row.draw_date,
+        numbers=list(row.numbers or []),
+        bonus=row.bonus,
+    )
 
 
 def _load_draws_from_db() -> List[LottoDraw]:
     with session_scope() as session:
-        rows = session.scalars(
-            select(LottoDrawORM).order_by(LottoDrawORM.draw_no.asc())
+        rows = session.execute(
+            select(*_DRAW_COLUMNS).order_by(LottoDrawORM.draw_no.asc())
         ).all()
-    return [
-        LottoDraw(
-            draw_no=row.draw_no,
-            draw_date=row.draw_date,
-            numbers=list(row.numbers or []),
-            bonus=row.bonus,
-        )
-        for row in rows
-    ]
+    return [_row_to_draw(row) for row in rows]
 
 
 def save_draws(draws: List[LottoDraw]) -> None:
@@ -148,8 +177,12 @@ def _save_draws_to_file(draws: List[LottoDraw]) -> None:
     serialized = [_draw_to_dict(draw) for draw in dedup]
     draw_path = _draw_file()
     tmp_path = draw_path.with_suffix(".tmp")
-    tmp_path.write_text(json.dumps(serialized, indent=2))
-    tmp_path.replace(draw_path)
+    with open(tmp_path, "wb") as handle:
+        handle.write(orjson.dumps(serialized, option=orjson.OPT_INDENT_2))
+        handle.flush()
+        # Make the data durable before the rename publishes it.
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, draw_path)
 
 
 def _save_draws_to_db(draws: List[LottoDraw]) -> None:
@@ -157,34 +190,55 @@ def _save_draws_to_db(draws: List[LottoDraw]) -> None:
     if not dedup:
         return
 
+    rows = [
+        {
+            "draw_no": draw.draw_no,
+            "draw_date": draw.draw_date,
+            "numbers": draw.numbers,
+            "bonus": draw.bonus,
+        }
+        for draw in dedup
+    ]
+    # Multi-row upserts instead of a SELECT plus INSERT/UPDATE per draw,
+    # chunked so a full back-fill does not build one giant statement.
     with session_scope() as session:
-        for draw in dedup:
-            record = session.get(LottoDrawORM, draw.draw_no)
-            if record is None:
-                record = LottoDrawORM(
-                    draw_no=draw.draw_no,
-                    draw_date=draw.draw_date,
-                    numbers=draw.numbers,
-                    bonus=draw.bonus,
+        for start in range(0, len(rows), _DRAW_UPSERT_BATCH_SIZE):
+            stmt = mysql_insert(LottoDrawORM).values(
+                rows[start : start + _DRAW_UPSERT_BATCH_SIZE]
+            )
+            session.execute(
+                stmt.on_duplicate_key_update(
+                    draw_date=stmt.inserted.draw_date,
+                    numbers=stmt.inserted.numbers,
+                    bonus=stmt.inserted.bonus,
+                    updated_at=func.now(),
                 )
-                session.add(record)
-            else:
-                record.draw_date = draw.draw_date
-                record.numbers = draw.numbers
-                record.bonus = draw.bonus
+            )
 
 
 def fetch_draw_info(draw_no: int) -> LottoDraw:
     """Fetch metadata for a specific Lotto draw via the DhLottery JSON endpoint."""
 
+    draw = _fetch_draw_info_cached(draw_no)
+    # The cached instance is shared process-wide; hand out its own number list.
+    return replace(draw, numbers=list(draw.numbers))
+
+
+# Published draws never change, so a successful lookup is safe to keep for
+# the life of the process; failures (e.g. a round not drawn yet) raise and
+# are therefore not cached.
+@lru_cache(maxsize=2048)
+def _fetch_draw_info_cached(draw_no: int) -> LottoDraw:
     response = fetch_url(
         get_settings().lotto_json_url,
         params={"method": "getLottoNumber", "drwNo": draw_no},
     )
-    payload = response.json()
+    return _draw_from_api_payload(draw_no, orjson.loads(response.content))
+
 
+def _draw_from_api_payload(draw_no: int, payload: Dict[str, object]) -> LottoDraw:
     if payload.get("returnValue") != "success":
-        raise ValueError(
+        raise DrawNotPublishedError(
             f"DhLottery API returned failure for draw {draw_no}: {payload}"
         )
 
@@ -204,32 +258,76 @@ def get_stored_draw(draw_no: int) -> LottoDraw | None:
     settings = get_settings()
     if settings.use_database_storage:
         with session_scope() as session:
-            row = session.get(LottoDrawORM, draw_no)
-            if row:
-                return LottoDraw(
-                    draw_no=row.draw_no,
-                    draw_date=row.draw_date,
-                    numbers=list(row.numbers or []),
-                    bonus=row.bonus,
-                )
-        return None
+            row = session.execute(
+                select(*_DRAW_COLUMNS).where(LottoDrawORM.draw_no == draw_no)
+            ).first()
+        return _row_to_draw(row) if row else None
 
-    for draw in load_stored_draws():
-        if draw.draw_no == draw_no:
-            return draw
+    stored = load_stored_draws()
+    index = bisect_left(stored, draw_no, key=attrgetter("draw_no"))
+    if index < len(stored) and stored[index].draw_no == draw_no:
+        return stored[index]
     return None
 
 
-def fetch_latest_draw_info() -> LottoDraw:
-    """Fetch metadata for the latest Lotto draw available on DhLottery."""
+def _draw_published(draw_no: int) -> bool:
+    try:
+        _fetch_draw_info_cached(draw_no)
+    except DrawNotPublishedError:
+        return False
+    return True
+
+
+def _probe_latest_draw_no(known: int) -> int:
+    """Find the newest draw after ``known`` through the JSON API.
+
+    Gallops forward until a round is reported as not drawn, then bisects
+    the last gap. When ``known`` is already the latest this is a single
+    small request; published rounds it touches stay in the
+    ``fetch_draw_info`` cache for the sync that usually follows.
+    """
+
+    low, step = known, 1
+    while _draw_published(low + step):
+        low += step
+        step *= 2
+    high = low + step
+    while high - low > 1:
+        middle = (low + high) // 2
+        if _draw_published(middle):
+            low = middle
+        else:
+            high = middle
+    return low
+
+
+def fetch_latest_draw_no(known: int | None = None) -> int:
+    """Return the newest draw number published by DhLottery.
+
+    ``known`` is a draw number already known to exist (e.g. the newest
+    stored one). When given, the JSON API is probed forward from it instead
+    of downloading the results page; the page is still used when the API
+    answers with anything other than a draw or an explicit failure.
+    """
+
+    if known:
+        try:
+            return _probe_latest_draw_no(known)
+        except (KeyError, TypeError, ValueError):
+            # Malformed/non-JSON API responses; the results page still works.
+            pass
 
     page_html = fetch_text(
         get_settings().lotto_result_url,
         params={"method": "byWin"},
     )
-    latest_draw_no = _extract_latest_draw_number(page_html)
+    return _extract_latest_draw_number(page_html)
+
 
-    return fetch_draw_info(latest_draw_no)
+def fetch_latest_draw_info(known: int | None = None) -> LottoDraw:
+    """Fetch metadata for the latest Lotto draw available on DhLottery."""
+
+    return fetch_draw_info(fetch_latest_draw_no(known))
 
 
 def get_latest_stored_draw() -> LottoDraw | None:
@@ -238,30 +336,33 @@ def get_latest_stored_draw() -> LottoDraw | None:
     settings = get_settings()
     if settings.use_database_storage:
         with session_scope() as session:
-            row = session.scalars(
-                select(LottoDrawORM).order_by(desc(LottoDrawORM.draw_no))
+            row = session.execute(
+                select(*_DRAW_COLUMNS).order_by(desc(LottoDrawORM.draw_no)).limit(1)
             ).first()
-        if row:
-            return LottoDraw(
-                draw_no=row.draw_no,
-                draw_date=row.draw_date,
-                numbers=list(row.numbers or []),
-                bonus=row.bonus,
-            )
-        return None
+        return _row_to_draw(row) if row else None
 
     stored = load_stored_draws()
     return stored[-1] if stored else None
 
 
+def _fetch_draws(draw_numbers: range) -> List[LottoDraw]:
+    """Fetch several draws concurrently, preserving ``draw_numbers`` order."""
+
+    if len(draw_numbers) <= 1:
+        return [fetch_draw_info(draw_no) for draw_no in draw_numbers]
+
+    workers = min(_SYNC_FETCH_WORKERS, len(draw_numbers))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(fetch_draw_info, draw_numbers))
+
+
 def sync_draw_storage() -> LottoSyncResult:
     """Download missing draws and append them to local storage."""
 
     stored = load_stored_draws()
     previous_max = stored[-1].draw_no if stored else 0
 
-    latest_draw = fetch_latest_draw_info()
-    latest_no = latest_draw.draw_no
+    latest_no = fetch_latest_draw_no(previous_max)
 
     if latest_no <= previous_max:
         return LottoSyncResult(
@@ -271,10 +372,8 @@ def sync_draw_storage() -> LottoSyncResult:
             draws=[],
         )
 
-    missing_draws: List[LottoDraw] = []
-    for draw_no in range(previous_max + 1, latest_no):
-        missing_draws.append(fetch_draw_info(draw_no))
-    missing_draws.append(latest_draw)
+    # The latest draw is fetched alongside the gap instead of before it.
+    missing_draws = _fetch_draws(range(previous_max + 1, latest_no + 1))
 
     if get_settings().use_database_storage:
         save_draws(missing_draws)
@@ -304,6 +403,15 @@ def _validate_ticket_numbers(numbers: List[int]) -> List[int]:
     return normalized
 
 
+def _number_mask(numbers: List[int]) -> int:
+    """Pack numbers 1~45 into an int with bit ``n`` set for each number ``n``."""
+
+    mask = 0
+    for num in numbers:
+        mask |= 1 << num
+    return mask
+
+
 def _determine_rank(match_count: int, bonus_matched: bool) -> int | None:
     if match_count == 6:
         return 1
@@ -322,11 +430,12 @@ def evaluate_ticket(draw: LottoDraw, numbers: List[int]) -> Dict[str, object]:
     """주어진 회차 결과와 번호 조합을 비교해 당첨 여부를 계산."""
 
     ticket = _validate_ticket_numbers(numbers)
-    ticket_set = set(ticket)
-    winning_set = set(draw.numbers)
-    matched_numbers = sorted(winning_set.intersection(ticket_set))
-    match_count = len(matched_numbers)
-    bonus_matched = draw.bonus in ticket_set
+    winning_numbers = sorted(draw.numbers)
+    ticket_mask = _number_mask(ticket)
+    matched_mask = ticket_mask & _number_mask(winning_numbers)
+    matched_numbers = [num for num in winning_numbers if matched_mask >> num & 1]
+    match_count = matched_mask.bit_count()
+    bonus_matched = bool(ticket_mask >> draw.bonus & 1)
     rank = _determine_rank(match_count, bonus_matched)
     is_winner = rank is not None
 
@@ -341,7 +450,7 @@ def evaluate_ticket(draw: LottoDraw, numbers: List[int]) -> Dict[str, object]:
     return {
         "draw_no": draw.draw_no,
         "numbers": sorted(ticket),
-        "winning_numbers": sorted(draw.numbers),
+        "winning_numbers": winning_numbers,
         "bonus": draw.bonus,
         "matched_numbers": matched_numbers,
         "match_count": match_count,
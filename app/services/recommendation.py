@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import time
 from datetime import datetime, timezone
 from secrets import SystemRandom
 from typing import Callable, Dict, List, Optional, Tuple
 
-from sqlalchemy import and_, select
+import numpy as np
+from sqlalchemy import and_, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 
-from analysis import calculate_number_frequencies
+from analysis import number_counts
 from app.core.config import get_settings
 from app.core.db import session_scope
 from app.models.tables import RecommendationSnapshotORM, UserRecommendationORM
@@ -16,7 +19,7 @@ from app.services.lotto import (
     LottoDraw,
     evaluate_ticket,
     fetch_draw_info,
-    fetch_latest_draw_info,
+    fetch_latest_draw_no,
     get_latest_stored_draw,
     get_stored_draw,
     load_stored_draws,
@@ -37,11 +40,12 @@ def _ensure_database_backend() -> None:
         )
 
 
-def _ensure_draws() -> Tuple[List[LottoDraw], int]:
-    draws = load_stored_draws()
+def _ensure_draws(draws: List[LottoDraw] | None = None) -> List[LottoDraw]:
+    if draws is None:
+        draws = load_stored_draws()
     if not draws:
         raise RecommendationError("저장된 회차가 없습니다. 먼저 /lotto/sync를 실행하세요.")
-    return draws, draws[-1].draw_no
+    return draws
 
 
 def _latest_draw_no() -> Optional[int]:
@@ -50,17 +54,7 @@ def _latest_draw_no() -> Optional[int]:
 
 
 def _recommendation_draw_no() -> int:
-    latest_stored = _latest_draw_no()
-    latest_remote = _latest_remote_draw_no()
-
-    latest_known = None
-    if latest_stored is not None and latest_remote is not None:
-        latest_known = max(latest_stored, latest_remote)
-    elif latest_stored is not None:
-        latest_known = latest_stored
-    elif latest_remote is not None:
-        latest_known = latest_remote
-
+    latest_known = _latest_known_draw_no()
     if latest_known is None:
         raise RecommendationError(
             "회차 정보를 확인할 수 없습니다. /lotto/sync를 먼저 실행하세요."
@@ -71,26 +65,95 @@ def _recommendation_draw_no() -> int:
 
 def _latest_known_draw_no() -> Optional[int]:
     latest_stored = _latest_draw_no()
-    latest_remote = _latest_remote_draw_no()
+    known = [
+        draw_no
+        for draw_no in (latest_stored, _latest_remote_draw_no(latest_stored))
+        if draw_no is not None
+    ]
+    return max(known, default=None)
+
+
+# DhLottery publishes one draw a week; re-reading its results page on every
+# recommendation request only adds an HTTP round trip.
+_REMOTE_DRAW_NO_TTL_SECONDS = 30.0
+_remote_draw_no_cache: Tuple[float, Optional[int]] | None = None
+
 
-    if latest_stored is not None and latest_remote is not None:
-        return max(latest_stored, latest_remote)
-    if latest_stored is not None:
-        return latest_stored
-    if latest_remote is not None:
-        return latest_remote
-    return None
+def _latest_remote_draw_no(latest_stored: Optional[int] = None) -> Optional[int]:
+    global _remote_draw_no_cache
 
+    now = time.monotonic()
+    cached = _remote_draw_no_cache
+    if cached is not None and cached[0] > now:
+        return cached[1]
 
-def _latest_remote_draw_no() -> Optional[int]:
     try:
-        return fetch_latest_draw_info().draw_no
+        draw_no: Optional[int] = fetch_latest_draw_no(latest_stored)
     except ValueError:
-        return None
+        draw_no = None
+    _remote_draw_no_cache = (now + _REMOTE_DRAW_NO_TTL_SECONDS, draw_no)
+    return draw_no
+
+
+_NUMBERS = np.arange(1, 46)
+_ODD_NUMBERS = _NUMBERS[_NUMBERS % 2 == 1]
+_EVEN_NUMBERS = _NUMBERS[_NUMBERS % 2 == 0]
+
+# Frequencies of the stored history, keyed by (draw count, latest draw_no).
+# Stored draws never change once published, so a sync is the only thing
+# that moves the key; only the newest table is kept.
+_frequency_cache: Dict[Tuple[int, int], np.ndarray] = {}
+
+
+def _frequency_table(draws: List[LottoDraw]) -> np.ndarray:
+    """Return the (shared, read-only) per-number counts for ``draws``."""
 
+    key = (len(draws), draws[-1].draw_no)
+    counts = _frequency_cache.get(key)
+    if counts is None:
+        counts = number_counts(draws)
+        counts.setflags(write=False)
+        _frequency_cache.clear()
+        _frequency_cache[key] = counts
+    return counts
 
-def _frequency_table(draws: List[LottoDraw]) -> Dict[int, int]:
-    return calculate_number_frequencies(draws)
+
+def _frequency_counts(draws: List[LottoDraw] | None = None) -> np.ndarray:
+    """Per-number counts, skipping the full history load when still current.
+
+    With the database backend the latest draw_no is a single indexed row,
+    so a memoized table for that draw is reused without reading every draw.
+    """
+
+    if draws is None and _frequency_cache and get_settings().use_database_storage:
+        (_, cached_draw_no), counts = next(iter(_frequency_cache.items()))
+        if cached_draw_no == _latest_draw_no():
+            return counts
+    return _frequency_table(_ensure_draws(draws))
+
+
+def _pick_by_frequency(
+    counts: np.ndarray,
+    candidates: np.ndarray,
+    k: int,
+    *,
+    most_frequent: bool,
+) -> List[int]:
+    """The ``k`` candidates with the highest/lowest counts, ties to smaller numbers.
+
+    Counts and numbers are folded into one distinct integer key per
+    candidate so an O(n) ``argpartition`` selects exactly the same set a
+    full sort would. The result is unordered.
+    """
+
+    # Numbers are < 64, so the low bits break ties without touching counts.
+    if most_frequent:
+        keys = candidates - counts[candidates] * 64
+    else:
+        keys = counts[candidates] * 64 + candidates
+    if k >= len(candidates):
+        return candidates.tolist()
+    return candidates[np.argpartition(keys, k - 1)[:k]].tolist()
 
 
 def _resolve_target_draw_no(draw_no: int | None) -> int:
@@ -99,8 +162,38 @@ def _resolve_target_draw_no(draw_no: int | None) -> int:
     return _recommendation_draw_no()
 
 
-def recommend_random(draw_no: int | None = None) -> Dict[str, object]:
-    numbers = sorted(_RNG.sample(range(1, 46), 6))
+def _random_numbers(k: int = 6) -> List[int]:
+    """``k`` distinct numbers in 1..45, uniformly chosen, in ascending order.
+
+    Each ``getrandbits`` call is an ``os.urandom`` read, so one 96-bit draw
+    is sliced into 6-bit indices (values >= 45 and repeats are rejected)
+    and the picks are collected as bits of a mask, which decodes already
+    sorted.
+    """
+
+    mask = 0
+    while True:
+        bits = _RNG.getrandbits(96)
+        for _ in range(16):
+            index = bits & 63
+            bits >>= 6
+            if index >= 45:
+                continue
+            mask |= 1 << index
+            if mask.bit_count() == k:
+                numbers = []
+                while mask:
+                    lowest = mask & -mask
+                    numbers.append(lowest.bit_length())
+                    mask ^= lowest
+                return numbers
+
+
+def recommend_random(
+    draw_no: int | None = None,
+    draws: List[LottoDraw] | None = None,
+) -> Dict[str, object]:
+    numbers = _random_numbers()
     target_draw_no = _resolve_target_draw_no(draw_no)
     return {
         "strategy": "random",
@@ -110,12 +203,13 @@ def recommend_random(draw_no: int | None = None) -> Dict[str, object]:
     }
 
 
-def recommend_frequency_hot(draw_no: int | None = None) -> Dict[str, object]:
-    draws, latest_draw_no = _ensure_draws()
-    freq = _frequency_table(draws)
-    top = sorted(freq.items(), key=lambda item: (-item[1], item[0]))[:6]
-    numbers = sorted(num for num, _ in top)
-    target_draw_no = _resolve_target_draw_no(draw_no) or (latest_draw_no + 1)
+def recommend_frequency_hot(
+    draw_no: int | None = None,
+    draws: List[LottoDraw] | None = None,
+) -> Dict[str, object]:
+    counts = _frequency_counts(draws)
+    numbers = sorted(_pick_by_frequency(counts, _NUMBERS, 6, most_frequent=True))
+    target_draw_no = _resolve_target_draw_no(draw_no)
     return {
         "strategy": "frequency_hot",
         "numbers": numbers,
@@ -124,12 +218,13 @@ def recommend_frequency_hot(draw_no: int | None = None) -> Dict[str, object]:
     }
 
 
-def recommend_frequency_cold(draw_no: int | None = None) -> Dict[str, object]:
-    draws, latest_draw_no = _ensure_draws()
-    freq = _frequency_table(draws)
-    bottom = sorted(freq.items(), key=lambda item: (item[1], item[0]))[:6]
-    numbers = sorted(num for num, _ in bottom)
-    target_draw_no = _resolve_target_draw_no(draw_no) or (latest_draw_no + 1)
+def recommend_frequency_cold(
+    draw_no: int | None = None,
+    draws: List[LottoDraw] | None = None,
+) -> Dict[str, object]:
+    counts = _frequency_counts(draws)
+    numbers = sorted(_pick_by_frequency(counts, _NUMBERS, 6, most_frequent=False))
+    target_draw_no = _resolve_target_draw_no(draw_no)
     return {
         "strategy": "frequency_cold",
         "numbers": numbers,
@@ -138,23 +233,16 @@ def recommend_frequency_cold(draw_no: int | None = None) -> Dict[str, object]:
     }
 
 
-def recommend_balanced_parity(draw_no: int | None = None) -> Dict[str, object]:
-    draws, latest_draw_no = _ensure_draws()
-    freq = _frequency_table(draws)
-
-    odds = sorted(
-        ((num, count) for num, count in freq.items() if num % 2 == 1),
-        key=lambda item: (-item[1], item[0]),
-    )
-    evens = sorted(
-        ((num, count) for num, count in freq.items() if num % 2 == 0),
-        key=lambda item: (-item[1], item[0]),
-    )
-    if len(odds) < 3 or len(evens) < 3:
-        raise RecommendationError("짝수/홀수 데이터가 충분하지 않습니다.")
+def recommend_balanced_parity(
+    draw_no: int | None = None,
+    draws: List[LottoDraw] | None = None,
+) -> Dict[str, object]:
+    counts = _frequency_counts(draws)
 
-    numbers = sorted([num for num, _ in odds[:3]] + [num for num, _ in evens[:3]])
-    target_draw_no = _resolve_target_draw_no(draw_no) or (latest_draw_no + 1)
+    odds = _pick_by_frequency(counts, _ODD_NUMBERS, 3, most_frequent=True)
+    evens = _pick_by_frequency(counts, _EVEN_NUMBERS, 3, most_frequent=True)
+    numbers = sorted(odds + evens)
+    target_draw_no = _resolve_target_draw_no(draw_no)
     return {
         "strategy": "balanced_parity",
         "numbers": numbers,
@@ -163,7 +251,12 @@ def recommend_balanced_parity(draw_no: int | None = None) -> Dict[str, object]:
     }
 
 
-StrategyHandler = Callable[[Optional[int]], Dict[str, object]]
+# Handlers take the target draw_no and, optionally, already-loaded draws so a
+# caller running several strategies reads the history only once.
+StrategyHandler = Callable[
+    [Optional[int], Optional[List[LottoDraw]]],
+    Dict[str, object],
+]
 
 STRATEGIES: Dict[str, StrategyHandler] = {
     "random": recommend_random,
@@ -171,87 +264,132 @@ STRATEGIES: Dict[str, StrategyHandler] = {
     "frequency_cold": recommend_frequency_cold,
     "balanced_parity": recommend_balanced_parity,
 }
+_STRATEGY_NAMES: Tuple[str, ...] = tuple(sorted(STRATEGIES))
 
 
 def _recommendation_cache_enabled() -> bool:
     return get_settings().use_database_storage
+
+
+# In-process copy of snapshot rows read back from the database for the
+# current target draw. Only rows that came from the database are kept, so
+# every worker serves the same (persisted) result; a new target draw_no or
+# the TTL expiring drops the whole entry.
+_SNAPSHOT_MEMO_TTL_SECONDS = 300.0
+_snapshot_memo: Tuple[int, float, Dict[str, Dict[str, object]]] | None = None
+
+
+def _memoized_snapshots(draw_no: int | None) -> Dict[str, Dict[str, object]]:
+    memo = _snapshot_memo
+    if memo is None or memo[0] != draw_no or memo[1] <= time.monotonic():
+        return {}
+    return memo[2]
+
+
+def _memoize_snapshots(
+    draw_no: int | None,
+    results: Dict[str, Dict[str, object]],
+) -> None:
+    global _snapshot_memo
+
+    if draw_no is None or not results:
+        return
+    memo = _snapshot_memo
+    now = time.monotonic()
+    if memo is not None and memo[0] == draw_no and memo[1] > now:
+        memo[2].update(results)
+    else:
+        _snapshot_memo = (draw_no, now + _SNAPSHOT_MEMO_TTL_SECONDS, dict(results))
+
+
 def _cache_lookup(strategy: str, draw_no: int | None) -> Optional[Dict[str, object]]:
     if not _recommendation_cache_enabled():
         return None
     with session_scope() as session:
-        record = session.scalars(
-            select(RecommendationSnapshotORM).where(
+        result = session.scalars(
+            select(RecommendationSnapshotORM.result)
+            .where(
                 RecommendationSnapshotORM.strategy == strategy,
                 RecommendationSnapshotORM.draw_no == draw_no,
             )
+            .limit(1)
         ).first()
-    if not record:
-        return None
-    return record.result
+    return result or None
 
 
 def _cache_store(strategy: str, draw_no: int | None, result: Dict[str, object]) -> None:
-    if not _recommendation_cache_enabled():
+    _cache_store_many(draw_no, {strategy: result})
+
+
+def _cache_store_many(
+    draw_no: int | None,
+    results: Dict[str, Dict[str, object]],
+) -> None:
+    """Upsert several strategy results for ``draw_no`` in one statement."""
+
+    if not _recommendation_cache_enabled() or not results:
         return
     now = datetime.now(timezone.utc)
+    stmt = mysql_insert(RecommendationSnapshotORM).values(
+        [
+            {
+                "strategy": strategy,
+                "draw_no": draw_no,
+                "result": result,
+                "updated_at": now,
+            }
+            for strategy, result in results.items()
+        ]
+    )
+    stmt = stmt.on_duplicate_key_update(
+        result=stmt.inserted.result,
+        updated_at=stmt.inserted.updated_at,
+    )
     with session_scope() as session:
-        record = session.scalars(
-            select(RecommendationSnapshotORM).where(
-                RecommendationSnapshotORM.strategy == strategy,
-                RecommendationSnapshotORM.draw_no == draw_no,
-            )
-        ).first()
-        if record is None:
-            record = RecommendationSnapshotORM(
-                strategy=strategy,
-                draw_no=draw_no,
-                result=result,
-                updated_at=now,
-            )
-            session.add(record)
-        else:
-            record.result = result
-            record.updated_at = now
+        session.execute(stmt)
+
 
+def _cache_lookup_all(draw_no: int | None) -> Dict[str, Dict[str, object]]:
+    """Cached results for every strategy of ``draw_no`` in one query."""
 
-def _cache_lookup_batch(draw_no: int | None) -> Optional[List[Dict[str, object]]]:
     if not _recommendation_cache_enabled() or draw_no is None:
-        return None
+        return {}
 
     with session_scope() as session:
-        records = session.scalars(
-            select(RecommendationSnapshotORM).where(
-                RecommendationSnapshotORM.draw_no == draw_no
+        rows = session.execute(
+            select(
+                RecommendationSnapshotORM.strategy,
+                RecommendationSnapshotORM.result,
+            ).where(
+                RecommendationSnapshotORM.draw_no == draw_no,
+                RecommendationSnapshotORM.strategy.in_(_STRATEGY_NAMES),
             )
         ).all()
+    return {row.strategy: row.result for row in rows if row.result}
 
-    if not records:
-        return None
-
-    strategy_order = {name: index for index, name in enumerate(sorted(STRATEGIES))}
-
-    def _key(record: RecommendationSnapshotORM) -> tuple[int, str]:
-        result = record.result or {}
-        strategy = result.get("strategy") or record.strategy or ""
-        return strategy_order.get(strategy, len(strategy_order)), strategy
-
-    return [record.result for record in sorted(records, key=_key) if record.result]
 
-
-def _run_strategy(strategy: str, draw_no: int | None) -> Dict[str, object]:
+def _run_strategy(
+    strategy: str,
+    draw_no: int | None,
+    draws: List[LottoDraw] | None = None,
+) -> Dict[str, object]:
     handler = STRATEGIES.get(strategy)
     if not handler:
-        available = ", ".join(sorted(STRATEGIES))
+        available = ", ".join(_STRATEGY_NAMES)
         raise RecommendationError(
             f"지원하지 않는 전략입니다: {strategy} (가능: {available})"
         )
-    return handler(draw_no)
+    return handler(draw_no, draws)
 
 
 def get_recommendation(strategy: str) -> Dict[str, object]:
     draw_no = _recommendation_draw_no()
+    cached = _memoized_snapshots(draw_no).get(strategy)
+    if cached:
+        return cached
     cached = _cache_lookup(strategy, draw_no)
     if cached:
+        _memoize_snapshots(draw_no, {strategy: cached})
         return cached
 
     result = _run_strategy(strategy, draw_no)
@@ -261,19 +399,23 @@ def get_recommendation(strategy: str) -> Dict[str, object]:
 
 def get_all_recommendations() -> List[Dict[str, object]]:
     draw_no = _recommendation_draw_no()
-    cached_batch = _cache_lookup_batch(draw_no) if draw_no is not None else None
-    if cached_batch:
-        return cached_batch
+    cached = _memoized_snapshots(draw_no)
+    if any(strategy not in cached for strategy in _STRATEGY_NAMES):
+        cached = _cache_lookup_all(draw_no)
+        _memoize_snapshots(draw_no, cached)
 
     results: List[Dict[str, object]] = []
-    for strategy in sorted(STRATEGIES):
-        cached = _cache_lookup(strategy, draw_no)
-        if cached:
-            results.append(cached)
-            continue
-        result = _run_strategy(strategy, draw_no)
-        _cache_store(strategy, draw_no, result)
+    fresh: Dict[str, Dict[str, object]] = {}
+    draws: List[LottoDraw] | None = None
+    for strategy in _STRATEGY_NAMES:
+        result = cached.get(strategy)
+        if result is None:
+            if draws is None:
+                draws = load_stored_draws()
+            result = _run_strategy(strategy, draw_no, draws)
+            fresh[strategy] = result
         results.append(result)
+    _cache_store_many(draw_no, fresh)
     return results
 
 
@@ -355,26 +497,31 @@ def get_user_recommendations(user_id: str) -> List[Dict[str, object]]:
 
     _ensure_database_backend()
     with session_scope() as session:
-        rows = session.scalars(
-            select(UserRecommendationORM)
+        rows = session.execute(
+            select(
+                UserRecommendationORM.id,
+                UserRecommendationORM.strategy,
+                UserRecommendationORM.numbers,
+                UserRecommendationORM.draw_no,
+                UserRecommendationORM.created_at,
+                UserRecommendationORM.evaluation,
+            )
             .where(UserRecommendationORM.user_id == user_id)
             .order_by(UserRecommendationORM.created_at.desc())
         ).all()
 
-    results: List[Dict[str, object]] = []
-    for document in rows:
-        results.append(
-            {
-                "id": str(document.id),
-                "userId": document.user_id,
-                "strategy": document.strategy,
-                "numbers": document.numbers,
-                "draw_no": document.draw_no,
-                "created_at": document.created_at,
-                "evaluation": document.evaluation,
-            }
-        )
-    return results
+    return [
+        {
+            "id": str(row.id),
+            "userId": user_id,
+            "strategy": row.strategy,
+            "numbers": row.numbers,
+            "draw_no": row.draw_no,
+            "created_at": row.created_at,
+            "evaluation": row.evaluation,
+        }
+        for row in rows
+    ]
 
 
 def evaluate_user_recommendation(
@@ -395,25 +542,28 @@ def evaluate_user_recommendation(
         raise RecommendationError("유효하지 않은 추천 ID입니다.") from exc
 
     with session_scope() as session:
-        record = session.get(UserRecommendationORM, record_id)
-        if not record or record.user_id != user_id:
-            raise RecommendationError("추천 정보를 찾을 수 없습니다.")
-        stored_numbers = sorted(int(num) for num in record.numbers or [])
-        stored_draw_no = record.draw_no
+        record = session.execute(
+            select(
+                UserRecommendationORM.draw_no,
+                UserRecommendationORM.numbers,
+            ).where(
+                UserRecommendationORM.id == record_id,
+                UserRecommendationORM.user_id == user_id,
+            )
+        ).first()
+    if record is None:
+        raise RecommendationError("추천 정보를 찾을 수 없습니다.")
 
-    if stored_draw_no != draw_no:
+    if record.draw_no != draw_no:
         raise RecommendationError("요청 회차가 저장된 추천 회차와 일치하지 않습니다.")
 
-    if sorted(int(num) for num in numbers) != stored_numbers:
+    # Strategies emit ascending numbers and they are stored as such, so
+    # only the requested numbers need normalising.
+    stored_numbers = record.numbers or []
+    if sorted(numbers) != stored_numbers:
         raise RecommendationError("요청 번호가 저장된 추천 번호와 일치하지 않습니다.")
 
-    settings = get_settings()
-    draw = None
-    if settings.use_database_storage:
-        draw = get_stored_draw(draw_no)
-    if draw is None:
-        draw = fetch_draw_info(draw_no)
-
+    # Bail out on undrawn rounds before touching storage or the network.
     latest_known_draw_no = _latest_known_draw_no()
     if latest_known_draw_no is not None and draw_no > latest_known_draw_no:
         raise RecommendationError(
@@ -421,6 +571,10 @@ def evaluate_user_recommendation(
             f"가장 최근 추첨은 {latest_known_draw_no}회차입니다."
         )
 
+    draw = get_stored_draw(draw_no)
+    if draw is None:
+        draw = fetch_draw_info(draw_no)
+
     result = evaluate_ticket(draw, stored_numbers)
     evaluation_payload = {
         "rank": result.get("rank"),
@@ -430,11 +584,19 @@ def evaluate_user_recommendation(
     }
 
     with session_scope() as session:
-        record = session.get(UserRecommendationORM, record_id)
-        if not record:
+        updated = session.execute(
+            update(UserRecommendationORM)
+            .where(
+                UserRecommendationORM.id == record_id,
+                UserRecommendationORM.user_id == user_id,
+            )
+            .values(
+                evaluation=evaluation_payload,
+                evaluated_at=datetime.now(timezone.utc),
+            )
+        )
+        if updated.rowcount != 1:
             raise RecommendationError("추천 정보를 찾을 수 없습니다.")
-        record.evaluation = evaluation_payload
-        record.evaluated_at = datetime.now(timezone.utc)
 
     return result
 
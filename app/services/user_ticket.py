@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 
 from app.core.config import get_settings
 from app.core.db import session_scope
@@ -13,7 +13,7 @@ from app.models.tables import UserTicketORM
 from app.services.lotto import (
     evaluate_ticket,
     fetch_draw_info,
-    fetch_latest_draw_info,
+    fetch_latest_draw_no,
     get_latest_stored_draw,
     get_stored_draw,
 )
@@ -25,19 +25,16 @@ class UserTicketError(ValueError):
 
 def _latest_known_draw_no() -> Optional[int]:
     latest_stored = get_latest_stored_draw()
-    latest_remote: int | None = None
+    stored_draw_no = latest_stored.draw_no if latest_stored else None
     try:
-        latest_remote = fetch_latest_draw_info().draw_no
+        latest_remote: int | None = fetch_latest_draw_no(stored_draw_no)
     except ValueError:
         latest_remote = None
 
-    if latest_stored is not None and latest_remote is not None:
-        return max(latest_stored.draw_no, latest_remote)
-    if latest_stored is not None:
-        return latest_stored.draw_no
-    if latest_remote is not None:
-        return latest_remote
-    return None
+    known = [
+        draw_no for draw_no in (stored_draw_no, latest_remote) if draw_no is not None
+    ]
+    return max(known, default=None)
 
 
 def _ensure_database_backend() -> None:
@@ -58,17 +55,14 @@ def save_user_ticket(
     if draw_no <= 0:
         raise UserTicketError("회차 번호는 1 이상이어야 합니다.")
 
+    _ensure_database_backend()
     latest_known = _latest_known_draw_no()
     if latest_known is not None and draw_no > latest_known:
         raise UserTicketError(
             f"{draw_no}회차는 아직 추첨되지 않았어요. 가장 최근 추첨은 {latest_known}회차입니다."
         )
 
-    settings = get_settings()
-    _ensure_database_backend()
-    draw = None
-    if settings.use_database_storage:
-        draw = get_stored_draw(draw_no)
+    draw = get_stored_draw(draw_no)
     if draw is None:
         draw = fetch_draw_info(draw_no)
 
@@ -77,25 +71,26 @@ def save_user_ticket(
     now = datetime.now(timezone.utc)
 
     with session_scope() as session:
-        record = UserTicketORM(
-            user_id=user_id,
-            draw_no=draw_no,
-            numbers=evaluation["numbers"],
-            evaluation=evaluation,
-            created_at=now,
-            updated_at=now,
+        result = session.execute(
+            insert(UserTicketORM).values(
+                user_id=user_id,
+                draw_no=draw_no,
+                numbers=evaluation["numbers"],
+                evaluation=evaluation,
+                created_at=now,
+                updated_at=now,
+            )
         )
-        session.add(record)
-        session.flush()
-
-        return {
-            "id": str(record.id),
-            "userId": record.user_id,
-            "draw_no": record.draw_no,
-            "numbers": record.numbers,
-            "created_at": record.created_at,
-            "evaluation": record.evaluation,
-        }
+        (ticket_id,) = result.inserted_primary_key
+
+    return {
+        "id": str(ticket_id),
+        "userId": user_id,
+        "draw_no": draw_no,
+        "numbers": evaluation["numbers"],
+        "created_at": now,
+        "evaluation": evaluation,
+    }
 
 
 __all__ = ["save_user_ticket", "get_user_tickets", "UserTicketError"]
@@ -108,22 +103,26 @@ def get_user_tickets(user_id: str) -> List[Dict[str, object]]:
     _ensure_database_backend()
 
     with session_scope() as session:
-        rows = session.scalars(
-            select(UserTicketORM)
+        rows = session.execute(
+            select(
+                UserTicketORM.id,
+                UserTicketORM.draw_no,
+                UserTicketORM.numbers,
+                UserTicketORM.created_at,
+                UserTicketORM.evaluation,
+            )
             .where(UserTicketORM.user_id == user_id)
             .order_by(UserTicketORM.created_at.desc())
         ).all()
 
-    results: List[Dict[str, object]] = []
-    for row in rows:
-        results.append(
-            {
-                "id": str(row.id),
-                "userId": row.user_id,
-                "draw_no": row.draw_no,
-                "numbers": row.numbers,
-                "created_at": row.created_at,
-                "evaluation": row.evaluation or {},
-            }
-        )
-    return results
+    return [
+        {
+            "id": str(row.id),
+            "userId": user_id,
+            "draw_no": row.draw_no,
+            "numbers": row.numbers,
+            "created_at": row.created_at,
+            "evaluation": row.evaluation or {},
+        }
+        for row in rows
+    ]
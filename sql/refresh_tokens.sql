@@ -1,12 +1,13 @@
 CREATE TABLE IF NOT EXISTS refresh_tokens (
     id INT NOT NULL AUTO_INCREMENT,
     user_id VARCHAR(64) NOT NULL,
-    token VARCHAR(512) NOT NULL,
+    token_hash CHAR(64) NOT NULL,
     expires_at DATETIME NOT NULL,
     created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     PRIMARY KEY (id),
-    UNIQUE KEY uq_refresh_tokens_token (token),
+    UNIQUE KEY uq_refresh_tokens_token_hash (token_hash),
     KEY ix_refresh_tokens_user_id (user_id),
+    KEY ix_refresh_tokens_expires_at (expires_at),
     CONSTRAINT fk_refresh_tokens_users
         FOREIGN KEY (user_id) REFERENCES users (user_id)
         ON DELETE CASCADE
@@ -0,0 +1,6 @@
+ALTER TABLE refresh_tokens
+    ADD COLUMN IF NOT EXISTS token_hash CHAR(64) NULL
+        AFTER user_id,
+    DROP COLUMN IF EXISTS token,
+    ADD UNIQUE KEY IF NOT EXISTS uq_refresh_tokens_token_hash (token_hash),
+    ADD KEY IF NOT EXISTS ix_refresh_tokens_expires_at (expires_at);
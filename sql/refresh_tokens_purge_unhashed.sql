@@ -0,0 +1,5 @@
+-- Rows left from the raw-token schema have no token_hash and cannot be
+-- re-hashed once the raw column is dropped. Deleting them signs out every
+-- user whose refresh token predates the migration; they must log in again.
+DELETE FROM refresh_tokens
+WHERE token_hash IS NULL;
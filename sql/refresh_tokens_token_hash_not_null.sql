@@ -0,0 +1,3 @@
+-- Align upgraded databases with refresh_tokens.sql once no NULL hashes remain.
+ALTER TABLE refresh_tokens
+    MODIFY token_hash CHAR(64) NOT NULL;
@@ -12,6 +12,7 @@ CREATE TABLE IF NOT EXISTS user_recommendations (
     UNIQUE KEY uq_user_draw_strategy (user_id, draw_no, strategy),
     KEY ix_user_recommendations_user_id (user_id),
     KEY ix_user_recommendations_draw_no (draw_no),
+    KEY ix_user_recommendations_user_created (user_id, created_at),
     CONSTRAINT fk_user_recommendations_users
         FOREIGN KEY (user_id) REFERENCES users (user_id)
         ON DELETE CASCADE
@@ -0,0 +1,2 @@
+ALTER TABLE user_recommendations
+    ADD KEY IF NOT EXISTS ix_user_recommendations_user_created (user_id, created_at);
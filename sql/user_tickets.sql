@@ -10,6 +10,7 @@ CREATE TABLE IF NOT EXISTS user_tickets (
     KEY ix_user_tickets_user_id (user_id),
     KEY ix_user_tickets_draw_no (draw_no),
     KEY ix_user_tickets_created_at (created_at),
+    KEY ix_user_tickets_user_created (user_id, created_at),
     CONSTRAINT fk_user_tickets_users
         FOREIGN KEY (user_id) REFERENCES users (user_id)
         ON DELETE CASCADE
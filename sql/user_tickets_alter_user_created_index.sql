@@ -0,0 +1,2 @@
+ALTER TABLE user_tickets
+    ADD KEY IF NOT EXISTS ix_user_tickets_user_created (user_id, created_at);